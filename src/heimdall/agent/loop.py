@@ -340,6 +340,9 @@ class Agent:
             for w in self._watchdogs.values():
                 await w.stop()
 
+            if self._demo_mode:
+                await self._demo_mode.close()
+
             self._unsubscribe_from_events()
 
             # Save trace (success or failure/interrupt)
@@ -422,7 +425,7 @@ class Agent:
             from heimdall.persistence import PersistedState, TaskProgress
 
             # Serialize history
-            history_data = [h.to_dict() for h in self._history.history]
+            history_data = [h.model_dump(mode="json") for h in self._history.history]
 
             # Build progress from agent output
             last_output = self._history.last_output()
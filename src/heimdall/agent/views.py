@@ -5,11 +5,12 @@ Defines the output format that makes the agent stateful by explicitly
 tracking thinking, evaluation, memory, and goals across steps.
 """
 
-import json
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class ActionResult(BaseModel):
@@ -72,6 +73,18 @@ class AgentOutput(BaseModel):
         description="List of actions to execute",
     )
 
+    # Keyed on the action list so model_copy(update=...) recomputes it
+    _action_names: tuple[list[dict[str, Any]], list[str]] | None = PrivateAttr(default=None)
+
+    @property
+    def action_names(self) -> list[str]:
+        """Names of the actions in this output, in order."""
+        cached = self._action_names
+        if cached is None or cached[0] is not self.action:
+            cached = (self.action, [next(iter(action), "unknown") for action in self.action])
+            self._action_names = cached
+        return cached[1]
+
     @property
     def current_state(self) -> AgentBrain:
         """Get the agent's mental state as AgentBrain."""
@@ -106,17 +119,6 @@ class BrowserStateSnapshot(BaseModel):
     screenshot_b64: str | None = None
     interacted_element: list[dict] | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            "url": self.url,
-            "title": self.title,
-            "element_count": self.element_count,
-            "screenshot_path": self.screenshot_path,
-            "screenshot_b64": self.screenshot_b64,
-            "interacted_element": self.interacted_element,
-        }
-
 
 class AgentHistory(BaseModel):
     """History item for each agent step."""
@@ -129,6 +131,25 @@ class AgentHistory(BaseModel):
     metadata: StepMetadata | None = None
     state_message: str | None = None
 
+    # Actions are fixed once a step has run, so their JSON rendering is cached.
+    # The cache is keyed on the action list itself so copies made with
+    # model_copy(update=...) don't reuse another output's rendering.
+    _actions_json: tuple[list[dict[str, Any]], str] | None = PrivateAttr(default=None)
+
+    def actions_json(self) -> str | None:
+        """Get this step's actions as indented JSON, or None if there are none."""
+        if not self.model_output or not self.model_output.action:
+            return None
+
+        actions = self.model_output.action
+        cached = self._actions_json
+        if cached is None or cached[0] is not actions:
+            import json
+
+            cached = (actions, json.dumps(actions, indent=1))
+            self._actions_json = cached
+        return cached[1]
+
     def format_for_prompt(self) -> str:
         """Format this history item for inclusion in the prompt."""
         if not self.model_output:
@@ -152,8 +173,7 @@ class AgentHistory(BaseModel):
         # Format action results
         if self.results:
             action_results = []
-            for _i, (action, result) in enumerate(zip(output.action, self.results, strict=False)):
-                action_name = list(action.keys())[0] if action else "unknown"
+            for action_name, result in zip(output.action_names, self.results, strict=False):
                 if result.success:
                     status = "Success"
                     if result.extracted_content:
@@ -168,18 +188,6 @@ class AgentHistory(BaseModel):
         lines.append(f"</step_{self.step_number}>")
         return "\n".join(lines)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            "step_number": self.step_number,
-            "model_input": self.model_input,
-            "model_output": self.model_output.model_dump() if self.model_output else None,
-            "results": [r.model_dump() for r in self.results],
-            "state": self.state.to_dict(),
-            "metadata": self.metadata.model_dump() if self.metadata else None,
-            "state_message": self.state_message,
-        }
-
 
 class AgentHistoryList(BaseModel):
     """List of agent history items."""
@@ -242,8 +250,8 @@ class AgentHistoryList(BaseModel):
         for i, h in enumerate(self.history):
             step_text = f"Step {i + 1}:\n"
 
-            if h.model_output and h.model_output.action:
-                actions_json = json.dumps(h.model_output.action, indent=1)
+            actions_json = h.actions_json()
+            if actions_json:
                 step_text += f"Actions: {actions_json}\n"
 
             if h.results:
@@ -256,19 +264,35 @@ class AgentHistoryList(BaseModel):
             steps.append(step_text)
         return steps
 
-    def save_to_file(self, filepath: str | Path) -> None:
-        """Save history to JSON file with proper serialization."""
-        try:
-            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-            data = {"history": [h.to_dict() for h in self.history]}
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            raise e
+    def save_to_file(self, filepath: "str | Path") -> None:
+        """Save history to JSON file with proper serialization.
+
+        Items are serialized and written one at a time so only a single
+        step's dump is held in memory, with the same layout as ``json.dump``
+        with ``indent=2``.
+        """
+        import json
+        from pathlib import Path
+
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            if not self.history:
+                f.write('{\n  "history": []\n}')
+                return
+
+            f.write('{\n  "history": [\n')
+            for i, item in enumerate(self.history):
+                if i:
+                    f.write(",\n")
+                dumped = json.dumps(item.model_dump(mode="json"), indent=2)
+                f.write("    " + dumped.replace("\n", "\n    "))
+            f.write("\n  ]\n}")
 
     @classmethod
-    def load_from_file(cls, filepath: str | Path) -> "AgentHistoryList":
+    def load_from_file(cls, filepath: "str | Path") -> "AgentHistoryList":
         """Load history from JSON file."""
+        import json
+
         with open(filepath, encoding="utf-8") as f:
             data = json.load(f)
         return cls.model_validate(data)
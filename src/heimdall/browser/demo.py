@@ -5,15 +5,583 @@ Provides element highlighting and floating tooltips to show
 what the agent is doing.
 """
 
+import asyncio
 import contextlib
+import json
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from heimdall.browser.session import BrowserSession
 
 logger = logging.getLogger(__name__)
 
+# Outlines `this` for `ms` milliseconds, then restores the original styles
+_OUTLINE_HIGHLIGHT_JS = """
+function(color, ms) {
+    const originalOutline = this.style.outline;
+    const originalOutlineOffset = this.style.outlineOffset;
+
+    this.style.outline = '3px solid ' + color;
+    this.style.outlineOffset = '2px';
+
+    setTimeout(() => {
+        this.style.outline = originalOutline;
+        this.style.outlineOffset = originalOutlineOffset;
+    }, ms);
+
+    return true;
+}
+"""
+
+# Page-side helper installed once per tab. Demo calls only ship arguments.
+_DEMO_HELPER_JS = """
+(() => {
+    if (window.__heimdallDemo) return;
+
+    const STYLES = `
+        @keyframes heimdall-fade {
+            0%, 100% {
+                opacity: 1;
+                box-shadow: 0 0 0 1px rgba(59, 130, 246, 0.2),
+                            0 0 12px 2px rgba(59, 130, 246, 0.15);
+            }
+            50% {
+                opacity: 0.85;
+                box-shadow: 0 0 0 2px rgba(59, 130, 246, 0.3),
+                            0 0 16px 4px rgba(59, 130, 246, 0.2);
+            }
+        }
+        @keyframes heimdall-pulse {
+            0%, 100% {
+                box-shadow:
+                    0 0 0 0 color-mix(in srgb, var(--heimdall-color) 53%, transparent),
+                    0 0 20px 5px color-mix(in srgb, var(--heimdall-color) 40%, transparent);
+                transform: scale(1);
+            }
+            50% {
+                box-shadow:
+                    0 0 0 8px color-mix(in srgb, var(--heimdall-color) 27%, transparent),
+                    0 0 30px 10px color-mix(in srgb, var(--heimdall-color) 27%, transparent);
+                transform: scale(1.02);
+            }
+        }
+        .heimdall-pulse {
+            outline: 3px solid var(--heimdall-color) !important;
+            outline-offset: 4px !important;
+            z-index: 999999 !important;
+            transition: all 0.2s ease !important;
+            animation: heimdall-pulse 0.6s ease-in-out infinite !important;
+        }
+        .heimdall-overlay {
+            position: fixed;
+            pointer-events: none;
+            z-index: 2147483647;
+            border: 2px solid rgba(59, 130, 246, 0.8);
+            border-radius: 3px;
+            box-shadow: 0 0 0 1px rgba(59, 130, 246, 0.2),
+                        0 0 12px 2px rgba(59, 130, 246, 0.15);
+            animation: heimdall-fade 0.8s ease-in-out infinite;
+            background: rgba(59, 130, 246, 0.04);
+        }
+        .heimdall-overlay-label {
+            position: absolute;
+            top: -22px;
+            left: 0;
+            background: rgba(59, 130, 246, 0.9);
+            color: white;
+            padding: 2px 8px;
+            border-radius: 3px;
+            font-size: 10px;
+            font-weight: 500;
+            font-family: -apple-system, system-ui, sans-serif;
+            white-space: nowrap;
+            box-shadow: 0 1px 4px rgba(0, 0, 0, 0.15);
+        }
+        .heimdall-label {
+            position: fixed;
+            transform: translateX(-50%);
+            color: white;
+            padding: 4px 12px;
+            border-radius: 4px;
+            font-size: 12px;
+            font-weight: bold;
+            font-family: -apple-system, system-ui, sans-serif;
+            white-space: nowrap;
+            z-index: 2147483647;
+            pointer-events: none;
+            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.3);
+        }
+        .heimdall-tooltip {
+            position: fixed;
+            background: rgba(0, 0, 0, 0.85);
+            color: white;
+            padding: 8px 16px;
+            border-radius: 6px;
+            font-size: 14px;
+            font-family: -apple-system, system-ui, sans-serif;
+            z-index: 999999;
+            pointer-events: none;
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
+            max-width: 300px;
+            word-wrap: break-word;
+        }
+    `;
+
+    // One stylesheet per document; re-added only if the page dropped it
+    function ensureStyles() {
+        if (document.getElementById('heimdall-styles')) return;
+
+        const style = document.createElement('style');
+        style.id = 'heimdall-styles';
+        style.textContent = STYLES;
+        (document.head || document.documentElement).appendChild(style);
+    }
+
+    let overlayProto = null;
+
+    // Built once; every overlay after that is a clone with new geometry
+    function overlayPrototype() {
+        if (overlayProto) return overlayProto;
+
+        overlayProto = document.createElement('div');
+        overlayProto.className = 'heimdall-overlay';
+
+        const label = document.createElement('div');
+        label.className = 'heimdall-overlay-label';
+        label.textContent = '● Target';
+        overlayProto.appendChild(label);
+        return overlayProto;
+    }
+
+    // Cleanup waits for a frame too, so removals batch with that frame's writes
+    function afterFrame(fn, ms) {
+        setTimeout(() => requestAnimationFrame(fn), ms);
+    }
+
+    // Several calls run in one batched evaluate, so ids need more than Date.now()
+    let seq = 0;
+
+    // Cleanups for everything still on screen, so clear() touches only those
+    const active = new Map();
+
+    function track(cleanup) {
+        const token = ++seq;
+        active.set(token, cleanup);
+        return token;
+    }
+
+    function finish(token) {
+        const cleanup = active.get(token);
+        if (!cleanup) return;
+        active.delete(token);
+        cleanup();
+    }
+
+    // Overlays waiting for the next frame, inserted together as one fragment
+    let pendingOverlays = [];
+
+    function flushOverlays() {
+        const fragment = document.createDocumentFragment();
+        for (const node of pendingOverlays) fragment.appendChild(node);
+        pendingOverlays = [];
+
+        ensureStyles();
+        document.body.appendChild(fragment);
+    }
+
+    // Removed overlays are kept for reuse instead of cloning fresh ones
+    const freeOverlays = [];
+    const MAX_FREE_OVERLAYS = 8;
+
+    function takeOverlay() {
+        const node = freeOverlays.pop();
+        if (node) return node;
+
+        const fresh = overlayPrototype().cloneNode(true);
+        fresh.id = 'heimdall-highlight-overlay-' + (++seq);
+        return fresh;
+    }
+
+    function releaseOverlay(node) {
+        node.remove();
+        if (freeOverlays.length < MAX_FREE_OVERLAYS) freeOverlays.push(node);
+    }
+
+    function overlay(x, y, width, height, ms) {
+        // Geometry comes measured from CDP, so there is nothing to read here;
+        // the detached node is prepared now and inserted on the next frame
+        const node = takeOverlay();
+        node.style.left = x + 'px';
+        node.style.top = y + 'px';
+        node.style.width = width + 'px';
+        node.style.height = height + 'px';
+
+        if (pendingOverlays.length === 0) requestAnimationFrame(flushOverlays);
+        pendingOverlays.push(node);
+
+        // Cleanup after duration
+        const token = track(() => releaseOverlay(node));
+        afterFrame(() => finish(token), ms);
+
+        return true;
+    }
+
+    // index -> element lookups, valid until the page's DOM next changes
+    const indexCache = new Map();
+    let indexObserver = null;
+
+    // Our own overlays, labels and styles all carry a heimdall-* id
+    function isOwnNode(node) {
+        return node.nodeType === 1 && node.id.startsWith('heimdall-');
+    }
+
+    function isOwnMutation(record) {
+        if (record.type !== 'childList') return false;
+        for (const node of record.addedNodes) if (!isOwnNode(node)) return false;
+        for (const node of record.removedNodes) if (!isOwnNode(node)) return false;
+        return true;
+    }
+
+    function findByIndex(index) {
+        if (!indexObserver) {
+            indexObserver = new MutationObserver(records => {
+                if (!records.every(isOwnMutation)) indexCache.clear();
+            });
+            indexObserver.observe(document, {
+                subtree: true,
+                childList: true,
+                characterData: true,
+                attributes: true,
+                attributeFilter: ['data-heimdall-index'],
+            });
+        }
+
+        const cached = indexCache.get(index);
+        if (cached) return cached;
+
+        // Find element by heimdall index attribute
+        let target = document.querySelector('[data-heimdall-index="' + index + '"]');
+
+        if (!target) {
+            // Fallback: try to find by visible index markers
+            target = document.evaluate(
+                "//*[contains(text(), '[" + index + "]')]",
+                document,
+                null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE,
+                null
+            ).singleNodeValue;
+        }
+
+        if (target) indexCache.set(index, target);
+        return target;
+    }
+
+    function byIndex(index, color, ms) {
+        const target = findByIndex(index);
+        if (!target) return false;
+
+        // Read phase: everything that needs layout, before any writes
+        const rect = target.getBoundingClientRect();
+        const isStatic = getComputedStyle(target).position === 'static';
+        const origPosition = target.style.position;
+
+        // Floating label, fixed to avoid layout issues/void elements
+        let top = rect.top - 35;
+        if (rect.top < 40) {
+            top = rect.bottom + 10;
+        }
+
+        let label = null;
+        const token = track(() => {
+            target.classList.remove('heimdall-pulse');
+            target.style.removeProperty('--heimdall-color');
+            if (isStatic) {
+                target.style.position = origPosition;
+            }
+            if (label) label.remove();
+        });
+
+        // Write phase: the pulse lives in the shared stylesheet, only the
+        // colour is set per call
+        requestAnimationFrame(() => {
+            // Cleared before this frame came round
+            if (!active.has(token)) return;
+
+            ensureStyles();
+
+            target.style.setProperty('--heimdall-color', color);
+            target.classList.add('heimdall-pulse');
+            if (isStatic) {
+                target.style.position = 'relative';
+            }
+
+            label = document.createElement('div');
+            label.id = 'heimdall-label-' + (++seq);
+            label.className = 'heimdall-label';
+            label.textContent = '→ Target [' + index + ']';
+            label.style.background = color;
+            label.style.top = top + 'px';
+            label.style.left = (rect.left + rect.width / 2) + 'px';
+            document.body.appendChild(label);
+
+            // Scroll into view smoothly
+            target.scrollIntoView({ behavior: 'smooth', block: 'center' });
+        });
+
+        // Cleanup after duration
+        afterFrame(() => finish(token), ms);
+
+        return true;
+    }
+
+    function bySelector(selector, color, ms) {
+        const el = document.querySelector(selector);
+        if (!el) return false;
+
+        const orig = el.style.outline;
+        const origOffset = el.style.outlineOffset;
+
+        el.style.outline = '3px solid ' + color;
+        el.style.outlineOffset = '2px';
+
+        const token = track(() => {
+            el.style.outline = orig;
+            el.style.outlineOffset = origOffset;
+        });
+        setTimeout(() => finish(token), ms);
+
+        return true;
+    }
+
+    let tooltipToken = 0;
+
+    function tooltip(text, x, y, ms) {
+        // Remove existing tooltip
+        finish(tooltipToken);
+
+        ensureStyles();
+        const tooltip = document.createElement('div');
+        tooltip.id = 'heimdall-tooltip';
+        tooltip.className = 'heimdall-tooltip';
+        tooltip.textContent = text;
+        tooltip.style.left = x + 'px';
+        tooltip.style.top = y + 'px';
+        document.body.appendChild(tooltip);
+
+        // Remove after duration
+        const token = track(() => tooltip.remove());
+        tooltipToken = token;
+        setTimeout(() => finish(token), ms);
+
+        return true;
+    }
+
+    function clear() {
+        // Overlays not yet inserted are dropped along with the live ones
+        pendingOverlays = [];
+
+        const cleanups = [...active.values()];
+        active.clear();
+        for (const cleanup of cleanups) cleanup();
+    }
+
+    window.__heimdallDemo = { overlay, byIndex, bySelector, tooltip, clear };
+})();
+"""
+
+
+def _helper_call(name: str, *args: Any) -> str:
+    """
+    Render a call into the page helper with JSON-encoded arguments.
+
+    JSON string literals are valid JS, so quotes, backslashes, newlines and
+    markup in tooltip text need no hand-written escaping.
+    """
+    encoded = ", ".join(json.dumps(arg, ensure_ascii=False) for arg in args)
+    return f"window.__heimdallDemo.{name}({encoded});"
+
+
+def _bbox_from_quad(quad: list[float]) -> tuple[float, float, float, float]:
+    """
+    Get the axis-aligned bounding box of a CDP quad.
+
+    Args:
+        quad: [x1, y1, x2, y2, x3, y3, x4, y4], clockwise from top-left. Corners
+            are compared rather than assumed so CSS transforms (rotation, skew)
+            are handled.
+
+    Returns:
+        (x, y, width, height)
+    """
+    x1, y1, x2, y2, x3, y3, x4, y4 = quad[:8]
+    x = min(x1, x2, x3, x4)
+    y = min(y1, y2, y3, y4)
+    return x, y, max(x1, x2, x3, x4) - x, max(y1, y2, y3, y4) - y
+
+
+class _BatchScheduler:
+    """
+    Coalesces JS snippets queued within one event-loop tick.
+
+    Work is split into two levels: box-model reads go out first, all at
+    once, and page mutations are joined into a single Runtime.evaluate with
+    each snippet wrapped in its own try/catch. N overlays drawn in the same
+    step cost one read round-trip and one write round-trip instead of 2N.
+    """
+
+    def __init__(self, session: "BrowserSession"):
+        self._session = session
+        self._reads: list[tuple[int, bool, asyncio.Future[list[float]]]] = []
+        self._pending: list[tuple[str, asyncio.Future[None]]] = []
+        self._flush_scheduled = False
+        self._sends: set[asyncio.Task[None]] = set()
+        # CDP session -> identifier of the helper's init script in that tab
+        self._helper_scripts: dict[str, str] = {}
+
+    def has_pending(self) -> bool:
+        """Check if work is queued or a batch is still in flight."""
+        return bool(self._reads or self._pending or self._sends)
+
+    def has_helper(self) -> bool:
+        """Check if the page helper was installed in the current tab."""
+        try:
+            return self._session.session_id in self._helper_scripts
+        except RuntimeError:
+            # Session not started or already closed
+            return False
+
+    def has_any_helper(self) -> bool:
+        """Check if the page helper was installed in any tab."""
+        return bool(self._helper_scripts)
+
+    async def measure(self, backend_node_id: int, scroll: bool = False) -> list[float]:
+        """
+        Queue a border-box read and return the element's border quad.
+
+        Args:
+            backend_node_id: CDP backend node ID of the element
+            scroll: Scroll the element into view first, so the quad is its
+                on-screen position
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._reads.append((backend_node_id, scroll, future))
+        self._schedule_flush(loop)
+        return await future
+
+    async def submit(self, js: str) -> None:
+        """Queue a snippet and wait until the batch containing it has run."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending.append((js, future))
+        self._schedule_flush(loop)
+        await future
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Send everything queued so far, reads before writes."""
+        self._flush_scheduled = False
+        reads, self._reads = self._reads, []
+        batch, self._pending = self._pending, []
+
+        if reads:
+            self._track(self._read_boxes(reads))
+        if batch:
+            self._track(self._send(batch))
+
+    def _track(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def remove_helper(self) -> None:
+        """Stop injecting the page helper into new documents of every tab."""
+        scripts, self._helper_scripts = self._helper_scripts, {}
+        for session_id, identifier in scripts.items():
+            # Skip placeholders of installs that are still in flight
+            if not identifier:
+                continue
+            try:
+                await self._session.cdp_client.send.Page.removeScriptToEvaluateOnNewDocument(
+                    {"identifier": identifier},
+                    session_id=session_id,
+                )
+            except Exception as e:
+                logger.debug(f"Failed to remove demo helper script: {e}")
+
+    async def _ensure_helper(self) -> None:
+        """Install the page helper once per CDP session."""
+        session_id = self._session.session_id
+        if session_id in self._helper_scripts:
+            return
+
+        self._helper_scripts[session_id] = ""
+        try:
+            identifier = await self._session.add_init_script(_DEMO_HELPER_JS)
+        except Exception:
+            self._helper_scripts.pop(session_id, None)
+            raise
+        self._helper_scripts[session_id] = identifier
+
+    async def _read_boxes(self, reads: list[tuple[int, bool, asyncio.Future[list[float]]]]) -> None:
+        try:
+            dom = self._session.cdp_client.send.DOM
+            session_id = self._session.session_id
+
+            # CDP has no multi-node box model call, but requests sent together
+            # share one round-trip of latency over the websocket. A session
+            # handles its commands in order, so the scrolls queued ahead of
+            # the box model reads have already run when those are answered.
+            scrolls = [
+                dom.scrollIntoViewIfNeeded(
+                    {"backendNodeId": backend_node_id}, session_id=session_id
+                )
+                for backend_node_id, scroll, _ in reads
+                if scroll
+            ]
+            boxes = [
+                dom.getBoxModel({"backendNodeId": backend_node_id}, session_id=session_id)
+                for backend_node_id, _, _ in reads
+            ]
+            results = await asyncio.gather(*scrolls, *boxes, return_exceptions=True)
+        except Exception as e:
+            for _, _, future in reads:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        box_results = results[len(scrolls) :]
+        for (_, _, future), result in zip(reads, box_results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result.get("model", {}).get("border", []))
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future[None]]]) -> None:
+        body = "\n".join(f"try {{ {js} }} catch (e) {{}}" for js, _ in batch)
+
+        try:
+            await self._ensure_helper()
+            await self._session.execute_js(f"(function() {{\n{body}\n}})();", silent=True)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
 
 class DemoMode:
     """
@@ -24,9 +592,37 @@ class DemoMode:
     - Floating tooltips with action descriptions
     """
 
-    def __init__(self, session: "BrowserSession"):
+    def __init__(self, session: "BrowserSession", background: bool = True):
+        """
+        Args:
+            session: Browser session to draw into
+            background: If True, visual feedback is scheduled as background tasks
+                so callers don't wait on CDP round-trips. Set to False to await
+                each call (useful in tests).
+        """
         self._session = session
         self._enabled = True
+        self._background = background
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._batch = _BatchScheduler(session)
+
+    async def _run(self, coro: Coroutine[Any, Any, Any], description: str) -> None:
+        """Run a cosmetic CDP call, in the background unless disabled."""
+        if self._background:
+            task = asyncio.create_task(self._run_guarded(coro, description))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return
+
+        await self._run_guarded(coro, description)
+
+    @staticmethod
+    async def _run_guarded(coro: Coroutine[Any, Any, Any], description: str) -> None:
+        """Await a visual feedback call, logging instead of raising on failure."""
+        try:
+            await coro
+        except Exception as e:
+            logger.debug(f"{description} failed: {e}")
 
     async def highlight_element(
         self,
@@ -45,47 +641,23 @@ class DemoMode:
         if not self._enabled:
             return
 
-        js = f"""
-        (function() {{
-            // Find element by backend node id (requires prior setup)
-            const elements = document.querySelectorAll('*');
-            let target = null;
-            
-            // Try to find by various means
-            for (const el of elements) {{
-                if (el.__heimdall_backend_id === {backend_node_id}) {{
-                    target = el;
-                    break;
-                }}
-            }}
-            
-            if (!target) {{
-                // Fallback: use CDP to get element reference
-                return false;
-            }}
-            
-            // Store original styles
-            const originalOutline = target.style.outline;
-            const originalOutlineOffset = target.style.outlineOffset;
-            
-            // Apply highlight
-            target.style.outline = '3px solid {color}';
-            target.style.outlineOffset = '2px';
-            
-            // Remove after duration
-            setTimeout(() => {{
-                target.style.outline = originalOutline;
-                target.style.outlineOffset = originalOutlineOffset;
-            }}, {int(duration * 1000)});
-            
-            return true;
-        }})();
-        """
+        await self._run(
+            self._outline_element(backend_node_id, color, int(duration * 1000)),
+            "Highlight",
+        )
 
-        try:
-            await self._session.execute_js(js)
-        except Exception as e:
-            logger.debug(f"Highlight failed: {e}")
+    async def _outline_element(self, backend_node_id: int, color: str, duration_ms: int) -> None:
+        """Resolve the element and outline it in the page."""
+        object_id = await self._session.resolve_backend_node(backend_node_id)
+        if not object_id:
+            logger.debug(f"Could not resolve element {backend_node_id} for highlight")
+            return
+
+        await self._session.call_function_on(
+            object_id,
+            _OUTLINE_HIGHLIGHT_JS,
+            [color, duration_ms],
+        )
 
     async def highlight_element_cdp(
         self,
@@ -95,8 +667,9 @@ class DemoMode:
         """
         Highlight element using CDP for accurate visual feedback on the actual element.
 
-        Uses CDP DOM.getBoxModel to get precise element coordinates, then creates
-        a visually striking overlay directly on the element.
+        Scrolls the element into view with CDP DOM.scrollIntoViewIfNeeded, uses
+        DOM.getBoxModel to get precise element coordinates, then creates a
+        visually striking overlay directly on the element.
 
         Args:
             backend_node_id: CDP backend node ID of the element
@@ -105,114 +678,21 @@ class DemoMode:
         if not self._enabled:
             return
 
-        try:
-            # Get element's box model from CDP
-            box_result = await self._session.cdp_client.send.DOM.getBoxModel(
-                {"backendNodeId": backend_node_id},
-                session_id=self._session.session_id,
-            )
-
-            box_model = box_result.get("model", {})
-            border = box_model.get("border", [])
-
-            if len(border) < 8:
-                logger.debug("Could not get element border box")
-                return
-
-            # Border quad: [x1, y1, x2, y2, x3, y3, x4, y4] (clockwise from top-left)
-            # Use min/max to handle CSS transforms (rotation, skew, etc.)
-            xs = border[0::2]  # x coordinates at indices 0, 2, 4, 6
-            ys = border[1::2]  # y coordinates at indices 1, 3, 5, 7
-            x = min(xs)
-            y = min(ys)
-            width = max(xs) - x
-            height = max(ys) - y
-
-            # Create overlay at exact element position
-            js = f"""
-            (function() {{
-                const overlayId = 'heimdall-highlight-overlay-' + Date.now();
-                
-                // Create overlay container - minimal clean style
-                const overlay = document.createElement('div');
-                overlay.id = overlayId;
-                overlay.style.cssText = `
-                    position: fixed;
-                    left: {x}px;
-                    top: {y}px;
-                    width: {width}px;
-                    height: {height}px;
-                    pointer-events: none;
-                    z-index: 2147483647;
-                    border: 2px solid rgba(59, 130, 246, 0.8);
-                    border-radius: 3px;
-                    box-shadow: 0 0 0 1px rgba(59, 130, 246, 0.2),
-                                0 0 12px 2px rgba(59, 130, 246, 0.15);
-                    animation: heimdall-fade 0.8s ease-in-out infinite;
-                    background: rgba(59, 130, 246, 0.04);
-                `;
-                
-                // Create minimal label
-                const label = document.createElement('div');
-                label.style.cssText = `
-                    position: absolute;
-                    top: -22px;
-                    left: 0;
-                    background: rgba(59, 130, 246, 0.9);
-                    color: white;
-                    padding: 2px 8px;
-                    border-radius: 3px;
-                    font-size: 10px;
-                    font-weight: 500;
-                    font-family: -apple-system, system-ui, sans-serif;
-                    white-space: nowrap;
-                    box-shadow: 0 1px 4px rgba(0, 0, 0, 0.15);
-                `;
-                label.textContent = '● Target';
-                overlay.appendChild(label);
-                
-                // Inject subtle animation
-                const style = document.createElement('style');
-                style.id = overlayId + '-style';
-                style.textContent = `
-                    @keyframes heimdall-fade {{
-                        0%, 100% {{ 
-                            opacity: 1;
-                            box-shadow: 0 0 0 1px rgba(59, 130, 246, 0.2),
-                                        0 0 12px 2px rgba(59, 130, 246, 0.15);
-                        }}
-                        50% {{ 
-                            opacity: 0.85;
-                            box-shadow: 0 0 0 2px rgba(59, 130, 246, 0.3),
-                                        0 0 16px 4px rgba(59, 130, 246, 0.2);
-                        }}
-                    }}
-                `;
-                document.head.appendChild(style);
-                document.body.appendChild(overlay);
-                
-                // Scroll element into view
-                const element = document.elementFromPoint({x + width / 2}, {y + height / 2});
-                if (element) {{
-                    element.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                }}
-                
-                // Cleanup after duration
-                setTimeout(() => {{
-                    const el = document.getElementById(overlayId);
-                    if (el) el.remove();
-                    const st = document.getElementById(overlayId + '-style');
-                    if (st) st.remove();
-                }}, {int(duration * 1000)});
-                
-                return true;
-            }})();
-            """
-
-            await self._session.execute_js(js)
+        await self._run(
+            self._draw_overlay(backend_node_id, duration),
+            "CDP highlight",
+        )
 
-        except Exception as e:
-            logger.debug(f"CDP highlight failed: {e}")
+    async def _draw_overlay(self, backend_node_id: int, duration: float) -> None:
+        """Measure the element's border box and draw an overlay on top of it."""
+        border = await self._batch.measure(backend_node_id, scroll=True)
+
+        if len(border) < 8:
+            logger.debug("Could not get element border box")
+            return
+
+        x, y, width, height = _bbox_from_quad(border)
+        await self._batch.submit(_helper_call("overlay", x, y, width, height, int(duration * 1000)))
 
     async def highlight_by_index(
         self,
@@ -231,140 +711,8 @@ class DemoMode:
         if not self._enabled:
             return
 
-        js = f"""
-        (function() {{
-            // Find element by heimdall index attribute
-            let target = document.querySelector('[data-heimdall-index="{index}"]');
-            
-            if (!target) {{
-                // Fallback: try to find by visible index markers
-                const marker = document.evaluate(
-                    "//*[contains(text(), '[{index}]')]",
-                    document,
-                    null,
-                    XPathResult.FIRST_ORDERED_NODE_TYPE,
-                    null
-                ).singleNodeValue;
-                if (marker) target = marker;
-            }}
-            
-            if (!target) return false;
-            
-            // Create unique animation name
-            const animId = 'heimdall-pulse-' + Date.now();
-            
-            // Inject pulse animation CSS
-            const style = document.createElement('style');
-            style.id = animId + '-style';
-            style.textContent = `
-                @keyframes ${{animId}} {{
-                    0% {{ 
-                        box-shadow: 0 0 0 0 {color}88, 0 0 20px 5px {color}66;
-                        transform: scale(1);
-                    }}
-                    50% {{ 
-                        box-shadow: 0 0 0 8px {color}44, 0 0 30px 10px {color}44;
-                        transform: scale(1.02);
-                    }}
-                    100% {{ 
-                        box-shadow: 0 0 0 0 {color}88, 0 0 20px 5px {color}66;
-                        transform: scale(1);
-                    }}
-                }}
-            `;
-            document.head.appendChild(style);
-            
-            // Store original styles
-            const origStyles = {{
-                outline: target.style.outline,
-                outlineOffset: target.style.outlineOffset,
-                boxShadow: target.style.boxShadow,
-                zIndex: target.style.zIndex,
-                position: target.style.position,
-                animation: target.style.animation,
-                transform: target.style.transform,
-                transition: target.style.transition,
-            }};
-            
-            // Apply highlight with pulsing glow
-            Object.assign(target.style, {{
-                outline: '3px solid {color}',
-                outlineOffset: '4px',
-                boxShadow: '0 0 0 0 {color}88, 0 0 25px 8px {color}66',
-                zIndex: '999999',
-                animation: animId + ' 0.6s ease-in-out infinite',
-                transition: 'all 0.2s ease',
-            }});
-            
-            if (getComputedStyle(target).position === 'static') {{
-                target.style.position = 'relative';
-            }}
-            
-            // Create floating label
-            const label = document.createElement('div');
-            label.id = animId + '-label';
-            label.textContent = '→ Target [{index}]';
-            Object.assign(label.style, {{
-                position: 'absolute',
-                top: '-30px',
-                left: '50%',
-                transform: 'translateX(-50%)',
-                background: '{color}',
-                color: 'white',
-                padding: '4px 12px',
-                borderRadius: '4px',
-                fontSize: '12px',
-                fontWeight: 'bold',
-                fontFamily: '-apple-system, system-ui, sans-serif',
-                whiteSpace: 'nowrap',
-                zIndex: '9999999',
-                pointerEvents: 'none',
-                boxShadow: '0 2px 8px rgba(0,0,0,0.3)',
-            }});
-            
-            // Position label relative to target
-            const rect = target.getBoundingClientRect();
-            
-            // Calculate fixed position to avoid layout issues/void elements
-            let top = rect.top - 35;
-            if (rect.top < 40) {{
-                top = rect.bottom + 10;
-            }}
-            
-            Object.assign(label.style, {{
-                position: 'fixed',
-                top: top + 'px',
-                left: (rect.left + rect.width / 2) + 'px',
-                transform: 'translateX(-50%)',
-                zIndex: '2147483647'
-            }});
-            
-            document.body.appendChild(label);
-            
-            // Scroll into view smoothly
-            target.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-            
-            // Cleanup after duration
-            setTimeout(() => {{
-                // Restore original styles
-                Object.assign(target.style, origStyles);
-                
-                // Remove label and animation style
-                const labelEl = document.getElementById(animId + '-label');
-                if (labelEl) labelEl.remove();
-                
-                const styleEl = document.getElementById(animId + '-style');
-                if (styleEl) styleEl.remove();
-            }}, {int(duration * 1000)});
-            
-            return true;
-        }})();
-        """
-
-        try:
-            await self._session.execute_js(js)
-        except Exception as e:
-            logger.debug(f"Highlight by index failed: {e}")
+        js = _helper_call("byIndex", index, color, int(duration * 1000))
+        await self._run(self._batch.submit(js), "Highlight by index")
 
     async def highlight_by_selector(
         self,
@@ -376,30 +724,8 @@ class DemoMode:
         if not self._enabled:
             return
 
-        js = f"""
-        (function() {{
-            const el = document.querySelector('{selector}');
-            if (!el) return false;
-            
-            const orig = el.style.outline;
-            const origOffset = el.style.outlineOffset;
-            
-            el.style.outline = '3px solid {color}';
-            el.style.outlineOffset = '2px';
-            
-            setTimeout(() => {{
-                el.style.outline = orig;
-                el.style.outlineOffset = origOffset;
-            }}, {int(duration * 1000)});
-            
-            return true;
-        }})();
-        """
-
-        try:
-            await self._session.execute_js(js)
-        except Exception as e:
-            logger.debug(f"Highlight by selector failed: {e}")
+        js = _helper_call("bySelector", selector, color, int(duration * 1000))
+        await self._run(self._batch.submit(js), "Highlight by selector")
 
     async def show_tooltip(
         self,
@@ -420,49 +746,8 @@ class DemoMode:
         if not self._enabled:
             return
 
-        # Escape text for JS
-        text = text.replace("'", "\\'").replace("\n", " ")
-
-        js = f"""
-        (function() {{
-            // Remove existing tooltip
-            const existing = document.getElementById('heimdall-tooltip');
-            if (existing) existing.remove();
-            
-            // Create tooltip
-            const tooltip = document.createElement('div');
-            tooltip.id = 'heimdall-tooltip';
-            tooltip.textContent = '{text}';
-            tooltip.style.cssText = `
-                position: fixed;
-                left: {x}px;
-                top: {y}px;
-                background: rgba(0, 0, 0, 0.85);
-                color: white;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-size: 14px;
-                font-family: -apple-system, system-ui, sans-serif;
-                z-index: 999999;
-                pointer-events: none;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-                max-width: 300px;
-                word-wrap: break-word;
-            `;
-            
-            document.body.appendChild(tooltip);
-            
-            // Remove after duration
-            setTimeout(() => tooltip.remove(), {int(duration * 1000)});
-            
-            return true;
-        }})();
-        """
-
-        try:
-            await self._session.execute_js(js)
-        except Exception as e:
-            logger.debug(f"Tooltip failed: {e}")
+        js = _helper_call("tooltip", text, x, y, int(duration * 1000))
+        await self._run(self._batch.submit(js), "Tooltip")
 
     async def show_action(
         self,
@@ -476,6 +761,9 @@ class DemoMode:
             action_name: Name of action (e.g., "click", "type")
             target_description: Description of target element
         """
+        if not self._enabled:
+            return
+
         text = action_name
         if target_description:
             text += f": {target_description}"
@@ -485,31 +773,50 @@ class DemoMode:
 
     async def clear(self) -> None:
         """Remove all demo mode overlays."""
-        js = """
-        (function() {
-            // Remove tooltip
-            const tooltip = document.getElementById('heimdall-tooltip');
-            if (tooltip) tooltip.remove();
-            
-            // Remove any remaining highlights by restoring styles
-            document.querySelectorAll('[data-heimdall-highlighted]').forEach(el => {
-                el.style.outline = '';
-                el.style.outlineOffset = '';
-                el.removeAttribute('data-heimdall-highlighted');
-            });
-        })();
-        """
+        # Let background calls queue their snippets so the clear rides in
+        # the same evaluate as the highlights it removes
+        await asyncio.sleep(0)
+
+        # Nothing queued and nothing was ever drawn in this tab
+        if not self._batch.has_pending() and not self._batch.has_helper():
+            return
 
         with contextlib.suppress(Exception):
-            await self._session.execute_js(js)
+            await self._batch.submit(_helper_call("clear"))
+
+        # Overlays still waiting on a box-model read draw after that batch,
+        # so they need one more pass to not outlive the clear
+        unfinished = [task for task in self._tasks if not task.done()]
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+            with contextlib.suppress(Exception):
+                await self._batch.submit(_helper_call("clear"))
 
     def enable(self) -> None:
         """Enable demo mode."""
         self._enabled = True
 
     def disable(self) -> None:
-        """Disable demo mode."""
+        """Disable demo mode and stop injecting the page helper."""
         self._enabled = False
+        if not self._batch.has_any_helper():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to reach the browser from; close() covers teardown
+            return
+
+        task = loop.create_task(
+            self._run_guarded(self._batch.remove_helper(), "Removing demo helper")
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Remove the page helper from every tab it was installed in."""
+        await self._run_guarded(self._batch.remove_helper(), "Removing demo helper")
 
     @property
     def is_enabled(self) -> bool:
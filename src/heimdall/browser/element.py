@@ -7,6 +7,8 @@ Based on browser-use patterns with fallback strategies.
 
 import asyncio
 import logging
+import platform
+import string
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -17,8 +19,609 @@ logger = logging.getLogger(__name__)
 
 ModifierType = Literal["Alt", "Control", "Meta", "Shift"]
 
+# CDP modifier bits
+_MODIFIER_MAP: dict[str, int] = {"Alt": 1, "Control": 2, "Meta": 4, "Shift": 8}
+
+# Cmd on macOS, Ctrl elsewhere
+_SELECT_ALL_MODIFIER = 4 if platform.system() == "Darwin" else 2
+
+# Gap between input events when the session humanizes input (seconds)
+_HUMAN_INPUT_DELAY = 0.03
+
+# char -> (key, code, windowsVirtualKeyCode, modifiers) for a US layout,
+# built once so typing is a dict lookup per character
+_KEY_TABLE: dict[str, tuple[str, str, int, int]] = {
+    **{c: (c, f"Key{c}", ord(c), 8) for c in string.ascii_uppercase},  # Shift
+    **{c: (c, f"Key{c.upper()}", ord(c.upper()), 0) for c in string.ascii_lowercase},
+    **{c: (c, f"Digit{c}", ord(c), 0) for c in string.digits},
+    " ": (" ", "Space", 32, 0),
+    "\n": ("\n", "Enter", 13, 0),
+    "\r": ("\r", "Enter", 13, 0),
+    "\t": ("\t", "Tab", 9, 0),
+    # Standard Punctuation
+    "-": ("-", "Minus", 189, 0),
+    "=": ("=", "Equal", 187, 0),
+    "[": ("[", "BracketLeft", 219, 0),
+    "]": ("]", "BracketRight", 221, 0),
+    "\\": ("\\", "Backslash", 220, 0),
+    ";": (";", "Semicolon", 186, 0),
+    "'": ("'", "Quote", 222, 0),
+    ",": (",", "Comma", 188, 0),
+    ".": (".", "Period", 190, 0),
+    "/": ("/", "Slash", 191, 0),
+    "`": ("`", "Backquote", 192, 0),
+    # Shifted Punctuation (US Layout)
+    "_": ("_", "Minus", 189, 8),  # Shift + -
+    "+": ("+", "Equal", 187, 8),  # Shift + =
+    "{": ("{", "BracketLeft", 219, 8),  # Shift + [
+    "}": ("}", "BracketRight", 221, 8),  # Shift + ]
+    "|": ("|", "Backslash", 220, 8),  # Shift + \
+    ":": (":", "Semicolon", 186, 8),  # Shift + ;
+    '"': ('"', "Quote", 222, 8),  # Shift + '
+    "<": ("<", "Comma", 188, 8),  # Shift + ,
+    ">": (">", "Period", 190, 8),  # Shift + .
+    "?": ("?", "Slash", 191, 8),  # Shift + /
+    "~": ("~", "Backquote", 192, 8),  # Shift + `
+    # Shifted Numbers
+    "!": ("!", "Digit1", 49, 8),  # Shift + 1
+    "@": ("@", "Digit2", 50, 8),  # Shift + 2
+    "#": ("#", "Digit3", 51, 8),  # Shift + 3
+    "$": ("$", "Digit4", 52, 8),  # Shift + 4
+    "%": ("%", "Digit5", 53, 8),  # Shift + 5
+    "^": ("^", "Digit6", 54, 8),  # Shift + 6
+    "&": ("&", "Digit7", 55, 8),  # Shift + 7
+    "*": ("*", "Digit8", 56, 8),  # Shift + 8
+    "(": ("(", "Digit9", 57, 8),  # Shift + 9
+    ")": (")", "Digit0", 48, 8),  # Shift + 0
+}
+
+
+def _key_events(char: str, key_info: tuple[str, str, int, int]) -> tuple[dict[str, Any], ...]:
+    """
+    Build the keyDown, char and keyUp dispatchKeyEvent payloads for a character.
+
+    Fields equal to their CDP default (empty code, zero key code or
+    modifiers) are left out to keep the messages small.
+    """
+    key, code, key_code, modifiers = key_info
+    extra: dict[str, Any] = {
+        name: value
+        for name, value in (("code", code), ("windowsVirtualKeyCode", key_code))
+        if value
+    }
+    mods: dict[str, Any] = {"modifiers": modifiers} if modifiers else {}
+    return (
+        {"type": "keyDown", "key": key, **extra, **mods},
+        {"type": "char", "text": char, "key": char, **mods},
+        {"type": "keyUp", "key": key, **extra, **mods},
+    )
+
+
+# Ready-made key event payloads for every character in _KEY_TABLE
+_KEY_EVENTS: dict[str, tuple[dict[str, Any], ...]] = {
+    char: _key_events(char, key_info) for char, key_info in _KEY_TABLE.items()
+}
+
+# Characters typed as a named key in key mode: char -> (key, virtual key code)
+_SPECIAL_KEYS: dict[str, tuple[str, int]] = {
+    "\n": ("Enter", 13),
+    "\r": ("Enter", 13),
+    "\t": ("Tab", 9),
+}
+
+# Extra events sent between keyDown and keyUp of a special key
+_KEY_CHAR_EVENTS: dict[str, tuple[dict[str, str], ...]] = {
+    # Enter also types a carriage return
+    "Enter": ({"type": "char", "text": "\r", "key": "Enter"},),
+}
+
+# Viewport rect of `this`, used when CDP geometry is unavailable
+_BOUNDING_RECT_JS = """
+function() {
+    const rect = this.getBoundingClientRect();
+    return {x: rect.left, y: rect.top,
+            width: rect.width, height: rect.height};
+}
+"""
+
+# Whether a click at (x, y) would reach `this`, and if not, why
+_HIT_TARGET_JS = """
+function(x, y) {
+    if (window.getComputedStyle(this).pointerEvents === 'none') {
+        return { ok: false, reason: 'pointer-events: none' };
+    }
+    const hitElement = document.elementFromPoint(x, y);
+    if (!hitElement) {
+        return { ok: false, reason: 'no element at point' };
+    }
+    // Check if hit element is this element or a descendant
+    if (this === hitElement || this.contains(hitElement)) {
+        return { ok: true, reason: '' };
+    }
+    // Check if this element is a descendant of hit element
+    // (click would still work in some cases)
+    if (hitElement.contains(this)) {
+        return { ok: true, reason: '' };
+    }
+    // Something else is at the point
+    const tag = hitElement.tagName.toLowerCase();
+    const id = hitElement.id ? '#' + hitElement.id : '';
+    const cls = hitElement.className ?
+        '.' + hitElement.className.split(' ')[0] : '';
+    return {
+        ok: false,
+        reason: 'covered by ' + tag + id + cls
+    };
+}
+"""
+
+# Clears an input or contenteditable `this` and fires input/change
+_CLEAR_FIELD_JS = """
+function() {
+    // Check if it's a contenteditable element
+    const ce = this.getAttribute('contenteditable');
+    const hasContentEditable = ce === 'true' || ce === '' ||
+                              this.isContentEditable === true;
+
+    if (hasContentEditable) {
+        // For contenteditable elements, clear all content
+        while (this.firstChild) {
+            this.removeChild(this.firstChild);
+        }
+        this.textContent = "";
+        this.innerHTML = "";
+
+        // Focus and position cursor at the beginning
+        this.focus();
+        const selection = window.getSelection();
+        const range = document.createRange();
+        range.setStart(this, 0);
+        range.setEnd(this, 0);
+        selection.removeAllRanges();
+        selection.addRange(range);
+
+        // Dispatch events
+        this.dispatchEvent(new Event("input", { bubbles: true }));
+        this.dispatchEvent(new Event("change", { bubbles: true }));
+
+        return {
+            cleared: true, method: 'contenteditable',
+            finalText: this.textContent
+        };
+    } else if (this.value !== undefined) {
+        // For regular inputs with value property
+        try {
+            this.select();
+        } catch (e) {
+            // ignore
+        }
+        this.value = "";
+        this.dispatchEvent(new Event("input", { bubbles: true }));
+        this.dispatchEvent(new Event("change", { bubbles: true }));
+        return {cleared: true, method: 'value', finalText: this.value};
+    } else {
+        return {
+            cleared: false, method: 'none',
+            error: 'Not a supported input type'
+        };
+    }
+}
+"""
+
+# Selects and deletes the value of an <input>/<textarea> `this` as an edit
+# command, so frameworks see a real input event; false for anything else
+_SELECT_DELETE_JS = """
+function() {
+    if (!(this instanceof HTMLInputElement || this instanceof HTMLTextAreaElement)) {
+        return false;
+    }
+    if (!this.value) return true;
+    try {
+        this.focus();
+        this.select();
+        document.execCommand('delete');
+    } catch (e) {
+        return false;
+    }
+    return this.value === '';
+}
+"""
+
+# Scrolls to, focuses and optionally clears `this` in one call before typing;
+# reports whether focus landed and whether the field is clear
+_PREPARE_FOR_TYPING_JS = (
+    """
+function(clear) {
+    if (this.scrollIntoViewIfNeeded) {
+        this.scrollIntoViewIfNeeded(true);
+    } else {
+        this.scrollIntoView({ behavior: 'instant', block: 'center', inline: 'center' });
+    }
+    this.focus();
+    if (this.getRootNode().activeElement !== this) {
+        return { focused: false, cleared: false };
+    }
+    const selectDelete = """
+    + _SELECT_DELETE_JS.strip()
+    + """;
+    return { focused: true, cleared: !clear || selectDelete.call(this) };
+}
+"""
+)
+
+# Centers `this` in the viewport; scrollIntoView also scrolls every
+# scrollable ancestor container on the way
+_SCROLL_INTO_VIEW_JS = """
+function() {
+    this.scrollIntoView({ behavior: 'instant', block: 'center', inline: 'center' });
+}
+"""
+
+# Inspects or selects options of native and custom dropdowns around `this`
+_DROPDOWN_INTERACTION_JS = r"""
+async function(args) {
+    const node = this;
+    const normalize = (value) =>
+        String(value ?? '').replace(/\s+/g, ' ').trim();
+    const normalizedNeedle = normalize(args.value).toLowerCase();
+    const isElement = (value) => value && value.nodeType === Node.ELEMENT_NODE;
+    const isVisible = (element) => {
+        if (!isElement(element) || !element.isConnected) return false;
+        const style = window.getComputedStyle(element);
+        if (!style) return false;
+        if (
+            style.display === 'none' ||
+            style.visibility === 'hidden'
+        ) {
+            return false;
+        }
+        if (element.getAttribute('aria-hidden') === 'true') return false;
+        const rect = element.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    const isDisabled = (element) => (
+        element.hasAttribute('disabled') ||
+        element.getAttribute('aria-disabled') === 'true'
+    );
+    const optionSelector = [
+        'option',
+        '[role="option"]',
+        '[role="treeitem"]',
+        '[role="gridcell"]',
+        '[role="menuitem"]',
+        '[role="menuitemcheckbox"]',
+        '[role="menuitemradio"]'
+    ].join(',');
+    const rootSelector = [
+        '[role="listbox"]',
+        '[role="menu"]',
+        '[role="tree"]',
+        '[role="grid"]',
+        '[data-state="open"]',
+        '[data-headlessui-state~="open"]'
+    ].join(',');
+    const roots = [];
+    const seenRoots = new Set();
+    const addRoot = (element) => {
+        if (!isElement(element) || seenRoots.has(element)) return;
+        seenRoots.add(element);
+        roots.push(element);
+    };
+    const toOption = (element) => {
+        const label = normalize(
+            element.innerText ||
+            element.textContent ||
+            element.getAttribute('aria-label') ||
+            element.getAttribute('label') ||
+            element.value ||
+            element.getAttribute('data-value') ||
+            element.title
+        );
+        const value = normalize(
+            element.value ??
+            element.getAttribute('value') ??
+            element.getAttribute('data-value') ??
+            element.getAttribute('aria-label') ??
+            label
+        );
+        return {
+            label,
+            value,
+            selected:
+                element.selected === true ||
+                element.getAttribute('aria-selected') === 'true' ||
+                element.getAttribute('aria-checked') === 'true',
+            disabled: isDisabled(element),
+            role: normalize(element.getAttribute('role')),
+            tag: normalize(element.tagName)
+        };
+    };
+    const controlledIds = (element) => [
+        element.getAttribute('aria-controls'),
+        element.getAttribute('aria-owns')
+    ]
+        .filter(Boolean)
+        .join(' ')
+        .split(/\s+/)
+        .map((value) => normalize(value))
+        .filter(Boolean);
+    const collectOptions = (root) => {
+        if (!isElement(root)) return [];
+        if (root.tagName === 'SELECT') {
+            return Array.from(root.options).map((element) => ({
+                element,
+                ...toOption(element)
+            }));
+        }
+        if (root.tagName === 'DATALIST') {
+            return Array.from(root.options || []).map((element) => ({
+                element,
+                ...toOption(element)
+            }));
+        }
+        const candidates = root.matches(optionSelector)
+            ? [root]
+            : Array.from(root.querySelectorAll(optionSelector));
+        return candidates
+            .filter((element) => isVisible(element) || root === node)
+            .map((element) => ({ element, ...toOption(element) }))
+            .filter((option) => option.label || option.value);
+    };
+    const addControlledRoots = (element) => {
+        controlledIds(element).forEach((id) => {
+            addRoot(document.getElementById(id));
+        });
+        const activeDescendant = normalize(
+            element.getAttribute('aria-activedescendant')
+        );
+        if (!activeDescendant) return;
+        const active = document.getElementById(activeDescendant);
+        if (!active) return;
+        addRoot(
+            active.closest(
+                '[role="listbox"], [role="menu"], [role="tree"], [role="grid"]'
+            )
+        );
+        addRoot(active);
+    };
+    const findNativeOption = () => Array.from(node.options).find((element) =>
+        normalize(element.text).toLowerCase() === normalizedNeedle ||
+        normalize(element.value).toLowerCase() === normalizedNeedle
+    );
+    const chooseNativeOption = (nativeOption) => {
+        node.value = nativeOption.value;
+        nativeOption.selected = true;
+        node.dispatchEvent(new Event('input', { bubbles: true }));
+        node.dispatchEvent(new Event('change', { bubbles: true }));
+        return {
+            label: normalize(nativeOption.text),
+            value: normalize(nativeOption.value)
+        };
+    };
+
+    // Native <select> with an exact option: skip the page-wide option scan
+    if (args.mode === 'select' && node.tagName === 'SELECT' && normalizedNeedle) {
+        const nativeOption = findNativeOption();
+        if (nativeOption && !isDisabled(nativeOption)) {
+            return {
+                kind: 'select',
+                opened: false,
+                option: chooseNativeOption(nativeOption)
+            };
+        }
+    }
+
+    const nodeRect = node.getBoundingClientRect();
+    const nodeCenter = {
+        x: nodeRect.left + nodeRect.width / 2,
+        y: nodeRect.top + nodeRect.height / 2
+    };
+    const distance = (element) => {
+        const rect = element.getBoundingClientRect();
+        const bx = rect.left + rect.width / 2;
+        const by = rect.top + rect.height / 2;
+        return Math.hypot(nodeCenter.x - bx, nodeCenter.y - by);
+    };
+    const addNearbyRoots = () => {
+        Array.from(document.querySelectorAll(rootSelector))
+            .filter((element) => isVisible(element))
+            .filter((element) => element !== node)
+            .filter((element) => {
+                return (
+                    element.matches(optionSelector) ||
+                    element.querySelector(optionSelector)
+                );
+            })
+            .map((element) => ({
+                element,
+                distance: distance(element)
+            }))
+            .sort((left, right) => left.distance - right.distance)
+            .slice(0, 5)
+            .forEach(({ element }) => addRoot(element));
+    };
+    const addIntrinsicRoots = () => {
+        if (
+            node.tagName === 'SELECT' ||
+            node.tagName === 'DATALIST'
+        ) {
+            addRoot(node);
+        }
+        addRoot(
+            node.closest(
+                '[role="listbox"], [role="menu"], [role="tree"], [role="grid"]'
+            )
+        );
+        if (node.matches(optionSelector)) {
+            addRoot(node);
+        }
+        addControlledRoots(node);
+        if (!node.id) return;
+        Array.from(document.querySelectorAll('[aria-labelledby]'))
+            .filter((element) => {
+                const labelledBy = normalize(
+                    element.getAttribute('aria-labelledby')
+                );
+                if (!labelledBy) return false;
+                return labelledBy.split(/\s+/).includes(node.id);
+            })
+            .forEach((element) => addRoot(element));
+    };
+    const snapshot = () => {
+        const seenOptions = new Set();
+        const options = [];
+        roots.forEach((root) => {
+            collectOptions(root).forEach((entry) => {
+                const key = [
+                    entry.label,
+                    entry.value,
+                    entry.role,
+                    entry.tag,
+                    entry.element.id || ''
+                ].join('::');
+                if (seenOptions.has(key)) return;
+                seenOptions.add(key);
+                options.push(entry);
+            });
+        });
+        return options;
+    };
+    const refreshOptions = () => {
+        roots.length = 0;
+        seenRoots.clear();
+        addIntrinsicRoots();
+        addNearbyRoots();
+        return snapshot();
+    };
+    const maybeOpen = async () => {
+        if (
+            node.tagName === 'SELECT' ||
+            node.matches('[role="listbox"], [role="menu"]')
+        ) {
+            return {
+                opened: false,
+                options: refreshOptions()
+            };
+        }
+        node.focus?.();
+        if (typeof node.showPicker === 'function') {
+            try {
+                node.showPicker();
+            } catch (error) {
+            }
+        }
+        node.click?.();
+        const maxWaitMs = 500;
+        const pollIntervalMs = 50;
+        let waitedMs = 0;
+        let options = refreshOptions();
+        let opened =
+            node.getAttribute('aria-expanded') === 'true' ||
+            roots.length > 0;
+
+        while (!options.length && waitedMs < maxWaitMs) {
+            await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
+            waitedMs += pollIntervalMs;
+            options = refreshOptions();
+            opened =
+                opened ||
+                node.getAttribute('aria-expanded') === 'true' ||
+                roots.length > 0;
+        }
+
+        return {
+            opened,
+            options
+        };
+    };
+
+    let options = refreshOptions();
+    let opened = false;
+
+    if (!options.length && args.openIfNeeded) {
+        const openResult = await maybeOpen();
+        opened = openResult.opened;
+        options = openResult.options;
+    }
+
+    const serializableOptions = options.map(({ element, ...option }) => option);
+    const kind = node.tagName === 'SELECT'
+        ? 'select'
+        : serializableOptions.some((option) =>
+            option.role.startsWith('menuitem')
+        )
+            ? 'menu'
+            : 'custom';
+
+    if (args.mode === 'inspect') {
+        return {
+            kind,
+            opened,
+            options: serializableOptions
+        };
+    }
+
+    if (!normalizedNeedle) {
+        throw new Error('Option value is required');
+    }
+
+    const exactMatch = options.find((option) =>
+        normalize(option.label).toLowerCase() === normalizedNeedle ||
+        normalize(option.value).toLowerCase() === normalizedNeedle
+    );
+    const partialMatches = options.filter((option) =>
+        normalize(option.label).toLowerCase().includes(normalizedNeedle) ||
+        normalize(option.value).toLowerCase().includes(normalizedNeedle)
+    );
+    const match = exactMatch || (
+        partialMatches.length === 1 ? partialMatches[0] : null
+    );
+
+    if (!match) {
+        throw new Error(
+            `Option not found: ${args.value}. Available: ${serializableOptions
+                .map((option) => option.label || option.value)
+                .filter(Boolean)
+                .join(', ')}`
+        );
+    }
+    if (match.disabled) {
+        throw new Error(`Option is disabled: ${match.label || match.value}`);
+    }
+
+    if (node.tagName === 'SELECT') {
+        const nativeOption = findNativeOption();
+        if (!nativeOption) {
+            throw new Error(`Option not found: ${args.value}`);
+        }
+        return {
+            kind,
+            opened,
+            option: chooseNativeOption(nativeOption)
+        };
+    }
+
+    match.element.scrollIntoView?.({ block: 'nearest', inline: 'nearest' });
+    match.element.click?.();
+    match.element.dispatchEvent?.(new Event('input', { bubbles: true }));
+    match.element.dispatchEvent?.(new Event('change', { bubbles: true }));
+    return {
+        kind,
+        opened,
+        option: {
+            label: match.label,
+            value: match.value
+        }
+    };
+}
+"""
+
+_CLICK_JS = "function() { this.click(); }"
+
+_FOCUS_JS = "function() { this.focus(); }"
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
     """Element bounding box."""
 
@@ -43,8 +646,23 @@ async def dispatch_mouse_click(
     button: Literal["left", "right", "middle"] = "left",
     click_count: int = 1,
     modifiers: int = 0,
+    delay: float = 0.0,
 ) -> None:
-    """Dispatch a mouse click at viewport CSS coordinates."""
+    """
+    Dispatch a mouse click at viewport CSS coordinates.
+
+    Chrome dispatches input events of a session in the order they are sent,
+    so no padding is needed between them unless delay asks for human pacing.
+
+    Args:
+        session: Browser session to click in
+        x: X coordinate
+        y: Y coordinate
+        button: Mouse button
+        click_count: Number of clicks (2 for double click)
+        modifiers: CDP modifier flags bitmask
+        delay: Seconds to pause between the move, press and release
+    """
     client = session.cdp_client
     session_id = session.session_id
 
@@ -52,7 +670,8 @@ async def dispatch_mouse_click(
         {"type": "mouseMoved", "x": x, "y": y},
         session_id=session_id,
     )
-    await asyncio.sleep(0.03)
+    if delay:
+        await asyncio.sleep(delay)
 
     try:
         await asyncio.wait_for(
@@ -69,7 +688,8 @@ async def dispatch_mouse_click(
             ),
             timeout=1.0,
         )
-        await asyncio.sleep(0.05)
+        if delay:
+            await asyncio.sleep(delay)
     except TimeoutError:
         logger.debug("mousePressed timed out")
 
@@ -100,6 +720,8 @@ class Element:
     with fallback strategies for reliability.
     """
 
+    __slots__ = ("_session", "_backend_node_id", "_node_id", "_attributes")
+
     def __init__(
         self,
         session: "BrowserSession",
@@ -109,106 +731,118 @@ class Element:
         self._session = session
         self._backend_node_id = backend_node_id
         self._node_id = node_id
+        # Attributes from DOM.describeNode, kept until an interaction
+        self._attributes: dict[str, str] | None = None
 
     @property
     def backend_node_id(self) -> int:
         return self._backend_node_id
 
+    def invalidate(self) -> None:
+        """Forget cached attributes, which an interaction may change."""
+        self._attributes = None
+
     async def click(
         self,
         button: Literal["left", "right", "middle"] = "left",
         click_count: int = 1,
         modifiers: list[ModifierType] | None = None,
+        bbox: BoundingBox | None = None,
     ) -> None:
         """
         Click the element using multiple strategies with fallback.
 
-        Strategies: DOM.getContentQuads -> DOM.getBoxModel
+        A caller-supplied bbox that is fully inside the viewport takes the
+        fast path: one hit-target probe at its center, then the click.
+        Otherwise, or when the probe misses, the robust path scrolls the
+        element into view and measures it with:
+        DOM.getBoxModel -> DOM.getContentQuads
         -> JS getBoundingClientRect -> JS .click()
 
-        Includes pre-click verification:
-        - Pointer events check
-        - Hit target verification
-        """
-        client = self._session.cdp_client
-        session_id = self._session.session_id
+        If the probe misses the box-model centre, the element is measured
+        again per line box, since a wrapped inline element's centre can fall
+        between its lines.
 
-        # Check pointer-events first
-        pointer_events_ok = await self._check_pointer_events()
-        if not pointer_events_ok:
-            logger.warning(
-                f"Element {self._backend_node_id} has pointer-events: none, "
-                "falling back to JS click"
-            )
-            await self._js_click()
-            return
+        Args:
+            button: Mouse button to click with
+            click_count: Number of clicks (2 for double click)
+            modifiers: Modifier keys held during the click
+            bbox: Current bounding box the caller already measured. If it is
+                fully inside the viewport, scrolling and measuring are skipped
+        """
+        self.invalidate()
+        modifier_flags = self._calculate_modifier_flags(modifiers)
 
-        # Get viewport dimensions for visibility checks
+        # Known geometry from the caller, usable as-is when already on screen
+        if bbox and bbox.width and bbox.height:
+            viewport_width, viewport_height = await self._session.get_viewport_size()
+            x, y, w, h = bbox.x, bbox.y, bbox.width, bbox.height
+            if x >= 0 and y >= 0 and x + w <= viewport_width and y + h <= viewport_height:
+                best_x, best_y = int(bbox.center_x), int(bbox.center_y)
+                hit_target_ok, reason = await self._verify_hit_target(best_x, best_y)
+                if hit_target_ok:
+                    await self._click_fast(best_x, best_y, button, click_count, modifier_flags)
+                    return
+                logger.debug(f"Supplied bbox is stale ({reason}), measuring element again")
+
+        await self._click_robust(button, click_count, modifier_flags)
+
+    async def _click_fast(
+        self,
+        x: int,
+        y: int,
+        button: Literal["left", "right", "middle"],
+        click_count: int,
+        modifiers: int,
+    ) -> None:
+        """Click at a point already known to hit the element, with JS click fallback."""
         try:
-            layout_metrics = await client.send.Page.getLayoutMetrics(session_id=session_id)
-            viewport_width = layout_metrics["layoutViewport"]["clientWidth"]
-            viewport_height = layout_metrics["layoutViewport"]["clientHeight"]
-        except Exception:
-            viewport_width, viewport_height = 1920, 1080  # Fallback defaults
+            await self._dispatch_click(x, y, button, click_count, modifiers)
+            logger.debug(f"Clicked element {self._backend_node_id} at ({x}, {y})")
+        except Exception as e:
+            # Final fallback to JS click
+            logger.debug(f"CDP click failed ({e}), falling back to JS click")
+            await self._js_click()
 
-        quads: list[list[float]] = []
+    async def _click_robust(
+        self,
+        button: Literal["left", "right", "middle"],
+        click_count: int,
+        modifiers: int,
+    ) -> None:
+        """
+        Scroll, measure and verify the element before clicking it.
 
-        # Method 1: DOM.getContentQuads
-        try:
-            result = await client.send.DOM.getContentQuads(
-                {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
-            )
-            if result.get("quads"):
-                quads = result["quads"]
-                logger.debug(f"Got {len(quads)} quads via getContentQuads")
-        except Exception as e:
-            logger.debug(f"getContentQuads failed: {e}")
+        Includes pre-click verification in a single probe:
+        - Pointer events check
+        - Hit target verification
+        """
+        # Scroll into view first, so geometry is measured once, in place.
+        # The viewport lookup does not depend on it and runs alongside.
+        (viewport_width, viewport_height), _ = await asyncio.gather(
+            self._session.get_viewport_size(),
+            self._scroll_into_view_if_needed(),
+        )
 
-        # Method 2: DOM.getBoxModel fallback
+        # Methods 1-2: DOM.getBoxModel (a single fixed-size box), then
+        # DOM.getContentQuads (one quad per line box)
+        quads = await self._box_model_quads()
+        from_box_model = bool(quads)
         if not quads:
-            try:
-                result = await client.send.DOM.getBoxModel(
-                    {"backendNodeId": self._backend_node_id},
-                    session_id=session_id,
-                )
-                model = result.get("model", {})
-                content = model.get("content", [])
-                if len(content) >= 8:
-                    quads = [content]
-                    logger.debug("Got geometry via getBoxModel")
-            except Exception as e:
-                logger.debug(f"getBoxModel failed: {e}")
+            quads = await self._content_quads()
 
         # Method 3: JS getBoundingClientRect fallback
         if not quads:
             try:
-                result = await client.send.DOM.resolveNode(
-                    {"backendNodeId": self._backend_node_id},
-                    session_id=session_id,
+                rect = await self._session.call_function_on_node(
+                    self._backend_node_id,
+                    _BOUNDING_RECT_JS,
                 )
-                object_id = result.get("object", {}).get("objectId")
-                if object_id:
-                    bounds_result = await client.send.Runtime.callFunctionOn(
-                        {
-                            "objectId": object_id,
-                            "functionDeclaration": """
-                                function() {
-                                    const rect = this.getBoundingClientRect();
-                                    return {x: rect.left, y: rect.top, 
-                                            width: rect.width, height: rect.height};
-                                }
-                            """,
-                            "returnByValue": True,
-                        },
-                        session_id=session_id,
-                    )
-                    rect = bounds_result.get("result", {}).get("value", {})
-                    if rect.get("width") and rect.get("height"):
-                        x, y = rect["x"], rect["y"]
-                        w, h = rect["width"], rect["height"]
-                        quads = [[x, y, x + w, y, x + w, y + h, x, y + h]]
-                        logger.debug("Got geometry via JS getBoundingClientRect")
+                if rect and rect.get("width") and rect.get("height"):
+                    x, y = rect["x"], rect["y"]
+                    w, h = rect["width"], rect["height"]
+                    quads = [[x, y, x + w, y, x + w, y + h, x, y + h]]
+                    logger.debug("Got geometry via JS getBoundingClientRect")
             except Exception as e:
                 logger.debug(f"JS getBoundingClientRect failed: {e}")
 
@@ -221,50 +855,71 @@ class Element:
         # Find the best quad (largest visible area within viewport)
         best_x, best_y = self._find_best_click_point(quads, viewport_width, viewport_height)
 
-        # Scroll into view first
+        # Verify pointer-events and hit target - check if our element will
+        # receive the click
+        hit_target_ok, reason = await self._verify_hit_target(best_x, best_y)
+
+        # The box-model centre of a wrapped inline element can sit between
+        # its line boxes, so retry on the line boxes themselves
+        if not hit_target_ok and from_box_model:
+            line_quads = await self._content_quads()
+            if line_quads:
+                best_x, best_y = self._find_best_click_point(
+                    line_quads, viewport_width, viewport_height
+                )
+                hit_target_ok, reason = await self._verify_hit_target(best_x, best_y)
+
+        if not hit_target_ok:
+            logger.warning(
+                f"Click at ({best_x}, {best_y}) would miss element "
+                f"{self._backend_node_id} ({reason}), using JS click"
+            )
+            await self._js_click()
+            return
+
+        await self._click_fast(best_x, best_y, button, click_count, modifiers)
+
+    async def _scroll_into_view_if_needed(self) -> None:
+        """Scroll via DOM.scrollIntoViewIfNeeded and wait a frame, or fall back to JS."""
         try:
-            await client.send.DOM.scrollIntoViewIfNeeded(
+            await self._session.cdp_client.send.DOM.scrollIntoViewIfNeeded(
                 {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
+                session_id=self._session.session_id,
             )
-            await asyncio.sleep(0.05)
+            await self._session.wait_for_frame()
         except Exception:
             # Fallback to JS scrollIntoView
             await self.scroll_into_view()
 
-        # Re-calculate click point after scroll (element may have moved)
+    async def _box_model_quads(self) -> list[list[float]]:
+        """Get the element's content box from DOM.getBoxModel."""
         try:
-            result = await client.send.DOM.getContentQuads(
+            result = await self._session.cdp_client.send.DOM.getBoxModel(
                 {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
-            )
-            if result.get("quads"):
-                quads = result["quads"]
-                best_x, best_y = self._find_best_click_point(quads, viewport_width, viewport_height)
-        except Exception:
-            pass  # Use previous coordinates
-
-        # Verify hit target - check if our element will receive the click
-        hit_target_ok, interceptor = await self._verify_hit_target(best_x, best_y)
-        if not hit_target_ok:
-            logger.warning(
-                f"Click at ({best_x}, {best_y}) would hit '{interceptor}' "
-                f"instead of element {self._backend_node_id}, using JS click"
+                session_id=self._session.session_id,
             )
-            await self._js_click()
-            return
-
-        # Calculate modifier flags
-        modifier_flags = self._calculate_modifier_flags(modifiers)
+            content = result.get("model", {}).get("content", [])
+            if len(content) >= 8:
+                logger.debug("Got geometry via getBoxModel")
+                return [content]
+        except Exception as e:
+            logger.debug(f"getBoxModel failed: {e}")
+        return []
 
-        # Perform the click
+    async def _content_quads(self) -> list[list[float]]:
+        """Get the element's per-line-box quads from DOM.getContentQuads."""
         try:
-            await self._dispatch_click(best_x, best_y, button, click_count, modifier_flags)
-            logger.debug(f"Clicked element {self._backend_node_id} at ({best_x}, {best_y})")
+            result = await self._session.cdp_client.send.DOM.getContentQuads(
+                {"backendNodeId": self._backend_node_id},
+                session_id=self._session.session_id,
+            )
+            quads = result.get("quads") or []
+            if quads:
+                logger.debug(f"Got {len(quads)} quads via getContentQuads")
+            return quads
         except Exception as e:
-            # Final fallback to JS click
-            logger.debug(f"CDP click failed ({e}), falling back to JS click")
-            await self._js_click()
+            logger.debug(f"getContentQuads failed: {e}")
+        return []
 
     def _find_best_click_point(
         self,
@@ -281,10 +936,9 @@ class Element:
                 continue
 
             # Calculate quad bounds
-            xs = [quad[i] for i in range(0, 8, 2)]
-            ys = [quad[i] for i in range(1, 8, 2)]
-            min_x, max_x = min(xs), max(xs)
-            min_y, max_y = min(ys), max(ys)
+            x1, y1, x2, y2, x3, y3, x4, y4 = quad[:8]
+            min_x, max_x = min(x1, x2, x3, x4), max(x1, x2, x3, x4)
+            min_y, max_y = min(y1, y2, y3, y4), max(y1, y2, y3, y4)
 
             # Skip if completely outside viewport
             if max_x < 0 or max_y < 0 or min_x > viewport_width or min_y > viewport_height:
@@ -308,11 +962,10 @@ class Element:
                 return int(viewport_width / 2), int(viewport_height / 2)
             best_quad = quads[0]  # Use first quad if none visible
 
-        # Calculate center of best quad (average of all points)
-        xs = [best_quad[i] for i in range(0, len(best_quad), 2)]
-        ys = [best_quad[i] for i in range(1, len(best_quad), 2)]
-        center_x = sum(xs) / len(xs)
-        center_y = sum(ys) / len(ys)
+        # Calculate center of best quad (average of its four corners)
+        x1, y1, x2, y2, x3, y3, x4, y4 = best_quad[:8]
+        center_x = (x1 + x2 + x3 + x4) / 4
+        center_y = (y1 + y2 + y3 + y4) / 4
 
         # Ensure within viewport
         center_x = max(0, min(viewport_width - 1, center_x))
@@ -324,9 +977,8 @@ class Element:
         """Calculate CDP modifier flags bitmask."""
         flags = 0
         if modifiers:
-            modifier_map = {"Alt": 1, "Control": 2, "Meta": 4, "Shift": 8}
             for mod in modifiers:
-                flags |= modifier_map.get(mod, 0)
+                flags |= _MODIFIER_MAP.get(mod, 0)
         return flags
 
     async def _dispatch_click(
@@ -345,182 +997,132 @@ class Element:
             button=button,
             click_count=click_count,
             modifiers=modifiers,
+            delay=_HUMAN_INPUT_DELAY if self._session.config.humanize else 0.0,
         )
 
+    async def _human_pause(self) -> None:
+        """Pause between input events only when the session humanizes input."""
+        if self._session.config.humanize:
+            await asyncio.sleep(_HUMAN_INPUT_DELAY)
+
     async def _js_click(self) -> None:
         """Click element using JavaScript as fallback."""
-        client = self._session.cdp_client
-        session_id = self._session.session_id
-
-        result = await client.send.DOM.resolveNode(
-            {"backendNodeId": self._backend_node_id},
-            session_id=session_id,
-        )
-        object_id = result.get("object", {}).get("objectId")
-
-        if not object_id:
-            raise RuntimeError(
-                f"Cannot click element {self._backend_node_id}: failed to resolve node"
-            )
-
-        await client.send.Runtime.callFunctionOn(
-            {
-                "objectId": object_id,
-                "functionDeclaration": "function() { this.click(); }",
-            },
-            session_id=session_id,
+        await self._session.call_function_on_node(
+            self._backend_node_id,
+            _CLICK_JS,
         )
-        await asyncio.sleep(0.05)
+        # Let click handlers render before the caller reads the page
+        await self._session.wait_for_frame()
         logger.debug(f"JS clicked element {self._backend_node_id}")
 
-    async def _check_pointer_events(self) -> bool:
-        """
-        Check if element has clickable pointer-events style.
-
-        Returns:
-            True if pointer-events allows clicking, False if 'none'
-        """
-        client = self._session.cdp_client
-        session_id = self._session.session_id
-
-        try:
-            result = await client.send.DOM.resolveNode(
-                {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
-            )
-            object_id = result.get("object", {}).get("objectId")
-            if not object_id:
-                return True  # Assume clickable if can't resolve
-
-            style_result = await client.send.Runtime.callFunctionOn(
-                {
-                    "objectId": object_id,
-                    "functionDeclaration": """
-                        function() {
-                            const style = window.getComputedStyle(this);
-                            return style.pointerEvents;
-                        }
-                    """,
-                    "returnByValue": True,
-                },
-                session_id=session_id,
-            )
-            pointer_events = style_result.get("result", {}).get("value", "auto")
-            return pointer_events != "none"
-        except Exception as e:
-            logger.debug(f"pointer-events check failed: {e}")
-            return True  # Assume clickable on error
-
     async def _verify_hit_target(self, x: int, y: int) -> tuple[bool, str]:
         """
-        Verify that elementFromPoint at (x, y) returns this element or a child.
+        Verify that the element accepts pointer events and that
+        elementFromPoint at (x, y) returns this element or a child.
+
+        Both checks run in one round-trip.
 
         Args:
             x: X coordinate to check
             y: Y coordinate to check
 
         Returns:
-            Tuple of (is_target_ok, interceptor_description)
+            Tuple of (is_target_ok, reason)
             - is_target_ok: True if this element will receive the click
-            - interceptor_description: Description of what would intercept, or empty string
+            - reason: Why the click would miss, or empty string
         """
-        client = self._session.cdp_client
-        session_id = self._session.session_id
-
         try:
-            result = await client.send.DOM.resolveNode(
-                {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
-            )
-            object_id = result.get("object", {}).get("objectId")
-            if not object_id:
-                return True, ""  # Can't verify, assume OK
-
             # Check if element at point is this element or a descendant
-            check_result = await client.send.Runtime.callFunctionOn(
-                {
-                    "objectId": object_id,
-                    "functionDeclaration": f"""
-                        function() {{
-                            const hitElement = document.elementFromPoint({x}, {y});
-                            if (!hitElement) {{
-                                return {{ ok: false, interceptor: 'no element at point' }};
-                            }}
-                            // Check if hit element is this element or a descendant
-                            if (this === hitElement || this.contains(hitElement)) {{
-                                return {{ ok: true, interceptor: '' }};
-                            }}
-                            // Check if this element is a descendant of hit element
-                            // (click would still work in some cases)
-                            if (hitElement.contains(this)) {{
-                                return {{ ok: true, interceptor: '' }};
-                            }}
-                            // Something else is at the point
-                            const tag = hitElement.tagName.toLowerCase();
-                            const id = hitElement.id ? '#' + hitElement.id : '';
-                            const cls = hitElement.className ? 
-                                '.' + hitElement.className.split(' ')[0] : '';
-                            return {{ 
-                                ok: false, 
-                                interceptor: tag + id + cls 
-                            }};
-                        }}
-                    """,
-                    "returnByValue": True,
-                },
-                session_id=session_id,
+            value = await self._session.call_function_on_node(
+                self._backend_node_id,
+                _HIT_TARGET_JS,
+                [x, y],
             )
-            value = check_result.get("result", {}).get("value", {})
-            return value.get("ok", True), value.get("interceptor", "")
+            value = value or {}
+            return value.get("ok", True), value.get("reason", "")
         except Exception as e:
             logger.debug(f"hit target verification failed: {e}")
             return True, ""  # Assume OK on error
 
-    async def fill(self, text: str, clear: bool = True) -> None:
+    async def fill(
+        self,
+        text: str,
+        clear: bool = True,
+        mode: Literal["insert", "keys"] = "insert",
+    ) -> None:
         """
-        Type text into the element with human-like key events.
+        Type text into the element, with multi-strategy focus and clear operations.
 
-        Uses proper keyDown → char → keyUp sequence for reliable input,
-        with multi-strategy focus and clear operations.
+        By default the whole text goes in with a single Input.insertText.
+        Key mode sends a keyDown → char → keyUp sequence per character instead,
+        for pages that only react to key events.
 
         Args:
             text: Text to type
             clear: If True, clear existing content first
+            mode: "insert" to insert the text at once, "keys" to type it key by key
         """
+        self.invalidate()
         client = self._session.cdp_client
         session_id = self._session.session_id
 
-        # Scroll into view first
-        try:
-            await client.send.DOM.scrollIntoViewIfNeeded(
-                {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
-            )
-            await asyncio.sleep(0.05)
-        except Exception:
-            await self.scroll_into_view()
+        # Scroll, focus and clear plain inputs in a single round-trip
+        focused, cleared = await self._prepare_for_typing(clear)
+
+        if not focused:
+            # Scroll into view first
+            await self._scroll_into_view_if_needed()
 
-        # Multi-strategy focus
-        await self._focus_robust()
+            # Multi-strategy focus
+            await self._focus_robust()
 
-        # Clear existing content if requested
-        if clear:
+        # Clear existing content if requested. The in-page clear above runs as
+        # an edit command inside the call, so only the fallback strategies
+        # need a frame for React to sync its state with the cleared field
+        if clear and not cleared:
             await self._clear_field_robust()
-            await asyncio.sleep(0.05)
+            await self._session.wait_for_frame()
 
-        # Type text using Input.insertText for reliability
-        # This is more reliable than individual key events for most inputs
         if text:
             logger.info(
                 f"Typing into element {self._backend_node_id}: '{text[:30]}...' (clear={clear})"
             )
-            await client.send.Input.insertText(
-                {"text": text},
-                session_id=session_id,
-            )
+            if mode == "keys":
+                await self._type_keys(text)
+            else:
+                # Type text using Input.insertText for reliability
+                # This is more reliable than individual key events for most inputs
+                await client.send.Input.insertText(
+                    {"text": text},
+                    session_id=session_id,
+                )
 
         logger.debug(f"Typed {len(text)} chars into element {self._backend_node_id}")
 
+    async def _prepare_for_typing(self, clear: bool) -> tuple[bool, bool]:
+        """
+        Scroll the element into view, focus it and optionally clear it in one call.
+
+        Args:
+            clear: If True, also clear a plain <input>/<textarea>
+
+        Returns:
+            Tuple of (focused, cleared)
+            - focused: True if the element now has focus
+            - cleared: True if the field is empty, or clearing was not requested
+        """
+        try:
+            result = await self._session.call_function_on_node(
+                self._backend_node_id,
+                _PREPARE_FOR_TYPING_JS,
+                [clear],
+            )
+        except Exception as e:
+            logger.debug(f"Combined scroll/focus/clear failed: {e}")
+            return False, False
+        result = result or {}
+        return bool(result.get("focused")), bool(result.get("cleared"))
+
     async def _focus_robust(self) -> None:
         """Focus element with multiple fallback strategies."""
         client = self._session.cdp_client
@@ -539,32 +1141,26 @@ class Element:
 
         # Strategy 2: JS focus()
         try:
-            result = await client.send.DOM.resolveNode(
-                {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
+            await self._session.call_function_on_node(
+                self._backend_node_id,
+                _FOCUS_JS,
             )
-            object_id = result.get("object", {}).get("objectId")
-            if object_id:
-                await client.send.Runtime.callFunctionOn(
-                    {
-                        "objectId": object_id,
-                        "functionDeclaration": "function() { this.focus(); }",
-                    },
-                    session_id=session_id,
-                )
-                logger.debug(f"JS focused element {self._backend_node_id}")
-                return
+            logger.debug(f"JS focused element {self._backend_node_id}")
+            return
         except Exception as e:
             logger.debug(f"JS focus failed: {e}")
 
-        # Strategy 3: Click to focus
+        # Strategy 3: Click to focus. Callers scroll the element into view
+        # first, so a fresh box lets click() skip scrolling again
         logger.debug("Falling back to click-to-focus")
-        await self.click()
-        await asyncio.sleep(0.1)
+        await self.click(bbox=await self.get_bounding_box())
+        await self._session.wait_for_frame(timeout=0.1)
 
     async def _clear_field_robust(self) -> None:
         """Clear text field using multiple strategies.
 
+        Strategy 0: Select + delete edit command in one round-trip
+                    (regular <input>/<textarea> only)
         Strategy 1: Ctrl/Cmd+A + Backspace (most reliable for React/contenteditable)
         Strategy 2: Triple-click (clickCount=3) + Delete key
         Strategy 3: JS-based clearing (fallback for regular inputs)
@@ -576,12 +1172,23 @@ class Element:
         client = self._session.cdp_client
         session_id = self._session.session_id
 
+        # Strategy 0: execCommand('delete') goes through the browser's editing
+        # pipeline like Backspace does, but as a single call
+        try:
+            if await self._session.call_function_on_node(
+                self._backend_node_id,
+                _SELECT_DELETE_JS,
+            ):
+                logger.info("Cleared field via select + delete")
+                return
+        except Exception as e:
+            logger.debug(f"Select + delete clear failed: {e}")
+
         # Strategy 1: Keyboard shortcuts Ctrl/Cmd+A + Backspace (best for React)
         # This is now the PRIMARY strategy because it properly syncs with
         # React/contenteditable elements that maintain their own state
         try:
             await self._clear_field_keyboard()
-            await asyncio.sleep(0.05)  # Give React time to sync
             logger.info("Cleared field via keyboard shortcuts (Ctrl+A + Backspace)")
             return
         except Exception as e:
@@ -591,30 +1198,9 @@ class Element:
         try:
             bbox = await self.get_bounding_box()
             if bbox:
-                x, y = int(bbox.center_x), int(bbox.center_y)
-
-                # Single triple-click (clickCount=3 selects all text)
-                await client.send.Input.dispatchMouseEvent(
-                    {
-                        "type": "mousePressed",
-                        "x": x,
-                        "y": y,
-                        "button": "left",
-                        "clickCount": 3,
-                    },
-                    session_id=session_id,
-                )
-                await client.send.Input.dispatchMouseEvent(
-                    {
-                        "type": "mouseReleased",
-                        "x": x,
-                        "y": y,
-                        "button": "left",
-                        "clickCount": 3,
-                    },
-                    session_id=session_id,
-                )
-                await asyncio.sleep(0.02)
+                # Single triple-click (clickCount=3 selects all text), reusing
+                # the box just measured so click() skips its own measuring
+                await self.click(click_count=3, bbox=bbox)
 
                 # Delete selected text
                 await client.send.Input.dispatchKeyEvent(
@@ -636,80 +1222,19 @@ class Element:
 
         # Strategy 3: JavaScript value/content clearing (fallback for regular inputs)
         try:
-            result = await client.send.DOM.resolveNode(
-                {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
+            clear_info = await self._session.call_function_on_node(
+                self._backend_node_id,
+                _CLEAR_FIELD_JS,
             )
-            object_id = result.get("object", {}).get("objectId")
-            if object_id:
-                clear_result = await client.send.Runtime.callFunctionOn(
-                    {
-                        "objectId": object_id,
-                        "functionDeclaration": """
-                            function() {
-                                // Check if it's a contenteditable element
-                                const ce = this.getAttribute('contenteditable');
-                                const hasContentEditable = ce === 'true' || ce === '' ||
-                                                          this.isContentEditable === true;
-
-                                if (hasContentEditable) {
-                                    // For contenteditable elements, clear all content
-                                    while (this.firstChild) {
-                                        this.removeChild(this.firstChild);
-                                    }
-                                    this.textContent = "";
-                                    this.innerHTML = "";
-
-                                    // Focus and position cursor at the beginning
-                                    this.focus();
-                                    const selection = window.getSelection();
-                                    const range = document.createRange();
-                                    range.setStart(this, 0);
-                                    range.setEnd(this, 0);
-                                    selection.removeAllRanges();
-                                    selection.addRange(range);
-
-                                    // Dispatch events
-                                    this.dispatchEvent(new Event("input", { bubbles: true }));
-                                    this.dispatchEvent(new Event("change", { bubbles: true }));
-
-                                    return {
-                                        cleared: true, method: 'contenteditable',
-                                        finalText: this.textContent
-                                    };
-                                } else if (this.value !== undefined) {
-                                    // For regular inputs with value property
-                                    try {
-                                        this.select();
-                                    } catch (e) {
-                                        // ignore
-                                    }
-                                    this.value = "";
-                                    this.dispatchEvent(new Event("input", { bubbles: true }));
-                                    this.dispatchEvent(new Event("change", { bubbles: true }));
-                                    return {cleared: true, method: 'value', finalText: this.value};
-                                } else {
-                                    return {
-                                        cleared: false, method: 'none',
-                                        error: 'Not a supported input type'
-                                    };
-                                }
-                            }
-                        """,
-                        "returnByValue": True,
-                    },
-                    session_id=session_id,
-                )
-
-                clear_info = clear_result.get("result", {}).get("value", {})
-                if clear_info.get("cleared"):
-                    final_text = clear_info.get("finalText", "")
-                    if not final_text or not final_text.strip():
-                        logger.info(f"Cleared field via JS ({clear_info.get('method')})")
-                        return
-                    logger.warning(f"JS clear incomplete, field still has: '{final_text[:50]}'")
-                else:
-                    logger.warning(f"JS clear failed: {clear_info.get('error', 'unknown')}")
+            clear_info = clear_info or {}
+            if clear_info.get("cleared"):
+                final_text = clear_info.get("finalText", "")
+                if not final_text or not final_text.strip():
+                    logger.info(f"Cleared field via JS ({clear_info.get('method')})")
+                    return
+                logger.warning(f"JS clear incomplete, field still has: '{final_text[:50]}'")
+            else:
+                logger.warning(f"JS clear failed: {clear_info.get('error', 'unknown')}")
         except Exception as e:
             logger.warning(f"JS clear exception: {e}")
 
@@ -718,13 +1243,9 @@ class Element:
         client = self._session.cdp_client
         session_id = self._session.session_id
 
-        import platform
-
-        modifier = 4 if platform.system() == "Darwin" else 2  # Cmd vs Ctrl
-
         # Select all
         await client.send.Input.dispatchKeyEvent(
-            {"type": "keyDown", "key": "a", "code": "KeyA", "modifiers": modifier},
+            {"type": "keyDown", "key": "a", "code": "KeyA", "modifiers": _SELECT_ALL_MODIFIER},
             session_id=session_id,
         )
         await client.send.Input.dispatchKeyEvent(
@@ -732,7 +1253,7 @@ class Element:
             session_id=session_id,
         )
 
-        await asyncio.sleep(0.02)
+        await self._human_pause()
 
         # Backspace to delete
         await client.send.Input.dispatchKeyEvent(
@@ -750,161 +1271,45 @@ class Element:
         )
         logger.debug("Cleared field via keyboard shortcuts")
 
+    async def _type_keys(self, text: str) -> None:
+        """Type text one key at a time, sending Enter and Tab as named keys."""
+        for char in text:
+            special = _SPECIAL_KEYS.get(char)
+            if special:
+                await self._type_special_key(*special)
+            else:
+                await self._type_char(char)
+            await self._human_pause()
+
     async def _type_char(self, char: str) -> None:
         """Type a single character with proper key event sequence."""
         client = self._session.cdp_client
         session_id = self._session.session_id
 
-        # Get key info for the character
-        key, code, key_code, modifiers = self._get_key_info(char)
-
-        # Step 1: keyDown (no text)
-        await client.send.Input.dispatchKeyEvent(
-            {
-                "type": "keyDown",
-                "key": key,
-                "code": code,
-                "windowsVirtualKeyCode": key_code,
-                "modifiers": modifiers,
-            },
-            session_id=session_id,
-        )
-
-        await asyncio.sleep(0.001)
-
-        # Step 2: char event (with text)
-        await client.send.Input.dispatchKeyEvent(
-            {
-                "type": "char",
-                "text": char,
-                "key": char,
-                "modifiers": modifiers,
-            },
-            session_id=session_id,
-        )
-
-        # Step 3: keyUp (no text)
-        await client.send.Input.dispatchKeyEvent(
-            {
-                "type": "keyUp",
-                "key": key,
-                "code": code,
-                "windowsVirtualKeyCode": key_code,
-                "modifiers": modifiers,
-            },
-            session_id=session_id,
-        )
+        # keyDown (no text) -> char (with text) -> keyUp (no text)
+        events = _KEY_EVENTS.get(char) or _key_events(char, self._get_key_info(char))
+        for event in events:
+            await client.send.Input.dispatchKeyEvent(event, session_id=session_id)
 
     async def _type_special_key(self, key: str, key_code: int) -> None:
         """Type a special key like Enter, Tab, etc."""
         client = self._session.cdp_client
         session_id = self._session.session_id
 
-        await client.send.Input.dispatchKeyEvent(
-            {
-                "type": "keyDown",
-                "key": key,
-                "code": key,
-                "windowsVirtualKeyCode": key_code,
-            },
-            session_id=session_id,
-        )
-        await asyncio.sleep(0.001)
-
-        # For Enter, also send a char event with carriage return
-        if key == "Enter":
-            await client.send.Input.dispatchKeyEvent(
-                {"type": "char", "text": "\r", "key": "Enter"},
-                session_id=session_id,
-            )
+        key_down = {"type": "keyDown", "key": key, "code": key, "windowsVirtualKeyCode": key_code}
+        key_up = {"type": "keyUp", "key": key, "code": key, "windowsVirtualKeyCode": key_code}
 
-        await client.send.Input.dispatchKeyEvent(
-            {
-                "type": "keyUp",
-                "key": key,
-                "code": key,
-                "windowsVirtualKeyCode": key_code,
-            },
-            session_id=session_id,
-        )
+        for event in (key_down, *_KEY_CHAR_EVENTS.get(key, ()), key_up):
+            await client.send.Input.dispatchKeyEvent(event, session_id=session_id)
 
     def _get_key_info(self, char: str) -> tuple[str, str, int, int]:
         """Get key name, code, virtual key code, and modifiers for a character."""
-        # Modifiers: 1=Alt, 2=Ctrl, 4=Meta, 8=Shift
-
-        # Upper case letters
-        if char.isalpha() and char.isupper():
-            base = char
-            code = f"Key{base}"
-            key_code = ord(base)
-            return char, code, key_code, 8  # Add Shift modifier
-
-        # Lower case letters
-        if char.isalpha():
-            base = char.upper()
-            code = f"Key{base}"
-            key_code = ord(base)
-            return char, code, key_code, 0
-
-        # Numbers
-        if char.isdigit():
-            code = f"Digit{char}"
-            key_code = ord(char)
-            return char, code, key_code, 0
-
-        # Special characters mapping
-        # Maps char to (code, key_code, modifiers)
-        special_chars = {
-            " ": ("Space", 32, 0),
-            "\n": ("Enter", 13, 0),
-            "\r": ("Enter", 13, 0),
-            "\t": ("Tab", 9, 0),
-            # Standard Punctuation
-            "-": ("Minus", 189, 0),
-            "=": ("Equal", 187, 0),
-            "[": ("BracketLeft", 219, 0),
-            "]": ("BracketRight", 221, 0),
-            "\\": ("Backslash", 220, 0),
-            ";": ("Semicolon", 186, 0),
-            "'": ("Quote", 222, 0),
-            ",": ("Comma", 188, 0),
-            ".": ("Period", 190, 0),
-            "/": ("Slash", 191, 0),
-            "`": ("Backquote", 192, 0),
-            # Shifted Punctuation (US Layout)
-            "_": ("Minus", 189, 8),  # Shift + -
-            "+": ("Equal", 187, 8),  # Shift + =
-            "{": ("BracketLeft", 219, 8),  # Shift + [
-            "}": ("BracketRight", 221, 8),  # Shift + ]
-            "|": ("Backslash", 220, 8),  # Shift + \
-            ":": ("Semicolon", 186, 8),  # Shift + ;
-            '"': ("Quote", 222, 8),  # Shift + '
-            "<": ("Comma", 188, 8),  # Shift + ,
-            ">": ("Period", 190, 8),  # Shift + .
-            "?": ("Slash", 191, 8),  # Shift + /
-            "~": ("Backquote", 192, 8),  # Shift + `
-            # Shifted Numbers
-            "!": ("Digit1", 49, 8),  # Shift + 1
-            "@": ("Digit2", 50, 8),  # Shift + 2
-            "#": ("Digit3", 51, 8),  # Shift + 3
-            "$": ("Digit4", 52, 8),  # Shift + 4
-            "%": ("Digit5", 53, 8),  # Shift + 5
-            "^": ("Digit6", 54, 8),  # Shift + 6
-            "&": ("Digit7", 55, 8),  # Shift + 7
-            "*": ("Digit8", 56, 8),  # Shift + 8
-            "(": ("Digit9", 57, 8),  # Shift + 9
-            ")": ("Digit0", 48, 8),  # Shift + 0
-        }
-
-        if char in special_chars:
-            code, key_code, modifiers = special_chars[char]
-            return char, code, key_code, modifiers
-
-        # Default: use the character itself
-        return char, "", 0, 0
+        # Anything off the US layout is sent as the character itself
+        return _KEY_TABLE.get(char, (char, "", 0, 0))
 
     async def hover(self) -> None:
         """Hover over the element."""
+        self.invalidate()
         bbox = await self.get_bounding_box()
         if not bbox:
             raise RuntimeError(f"Element {self._backend_node_id} not visible")
@@ -924,118 +1329,39 @@ class Element:
 
     async def focus(self) -> None:
         """Focus the element."""
-        client = self._session.cdp_client
-        session_id = self._session.session_id
-
-        # Get node ID from backend node ID
-        result = await client.send.DOM.describeNode(
-            {"backendNodeId": self._backend_node_id},
-            session_id=session_id,
-        )
-        node_id = result.get("node", {}).get("nodeId")
+        self.invalidate()
 
         try:
-            if node_id:
-                await client.send.DOM.focus(
-                    {"nodeId": node_id},
-                    session_id=session_id,
-                )
-            else:
-                await client.send.DOM.focus(
-                    {"backendNodeId": self._backend_node_id},
-                    session_id=session_id,
-                )
+            # DOM.focus takes the backend node ID directly, no describeNode needed
+            await self._session.cdp_client.send.DOM.focus(
+                {"backendNodeId": self._backend_node_id},
+                session_id=self._session.session_id,
+            )
             logger.debug(f"Focused element {self._backend_node_id}")
         except Exception as e:
             # DOM.focus can fail for contenteditable elements
             # Try JavaScript focus as fallback
             logger.debug(f"DOM.focus failed ({e}), trying JS focus")
-            result = await client.send.DOM.resolveNode(
-                {"backendNodeId": self._backend_node_id},
-                session_id=session_id,
-            )
-            object_id = result.get("object", {}).get("objectId")
-            if object_id:
-                await client.send.Runtime.callFunctionOn(
-                    {
-                        "objectId": object_id,
-                        "functionDeclaration": "function() { this.focus(); }",
-                        "returnByValue": True,
-                    },
-                    session_id=session_id,
+            try:
+                await self._session.call_function_on_node(
+                    self._backend_node_id,
+                    _FOCUS_JS,
                 )
-                logger.debug(f"JS focused element {self._backend_node_id}")
-            else:
+            except Exception:
                 raise RuntimeError(f"Could not focus element {self._backend_node_id}") from None
+            logger.debug(f"JS focused element {self._backend_node_id}")
 
     async def scroll_into_view(self) -> None:
         """
         Scroll element into view with container-aware scrolling.
 
-        First scrolls any scrollable parent containers, then scrolls
-        the element into the viewport.
+        Element.scrollIntoView scrolls any scrollable parent containers as
+        well as the viewport, so one call centers the element.
         """
-        client = self._session.cdp_client
-        session_id = self._session.session_id
-
-        # Get object ID for the element
-        result = await client.send.DOM.resolveNode(
-            {"backendNodeId": self._backend_node_id},
-            session_id=session_id,
+        await self._session.call_function_on_node(
+            self._backend_node_id,
+            _SCROLL_INTO_VIEW_JS,
         )
-        object_id = result.get("object", {}).get("objectId")
-
-        if object_id:
-            # Smart scroll: find scrollable container and scroll it first
-            await client.send.Runtime.callFunctionOn(
-                {
-                    "objectId": object_id,
-                    "functionDeclaration": """
-                        function() {
-                            // Find scrollable parent container
-                            function getScrollableParent(el) {
-                                if (!el || el === document.body) return null;
-                                const parent = el.parentElement;
-                                if (!parent) return null;
-                                
-                                const style = window.getComputedStyle(parent);
-                                const overflowY = style.overflowY;
-                                const overflowX = style.overflowX;
-                                
-                                // Check if parent is scrollable
-                                const isScrollable = (
-                                    (overflowY === 'auto' || overflowY === 'scroll' ||
-                                     overflowX === 'auto' || overflowX === 'scroll') &&
-                                    (parent.scrollHeight > parent.clientHeight ||
-                                     parent.scrollWidth > parent.clientWidth)
-                                );
-                                
-                                if (isScrollable) return parent;
-                                return getScrollableParent(parent);
-                            }
-                            
-                            // Scroll container first if found
-                            const container = getScrollableParent(this);
-                            if (container) {
-                                this.scrollIntoView({
-                                    behavior: 'instant',
-                                    block: 'center',
-                                    inline: 'center'
-                                });
-                            } else {
-                                // No scrollable container, scroll normally
-                                this.scrollIntoView({
-                                    behavior: 'instant',
-                                    block: 'center',
-                                    inline: 'center'
-                                });
-                            }
-                        }
-                    """,
-                    "returnByValue": True,
-                },
-                session_id=session_id,
-            )
 
         logger.debug(f"Scrolled element {self._backend_node_id} into view")
 
@@ -1067,46 +1393,22 @@ class Element:
         return None
 
     async def get_attribute(self, name: str) -> str | None:
-        """Get element attribute value."""
-        client = self._session.cdp_client
-        session_id = self._session.session_id
-
-        result = await client.send.DOM.describeNode(
-            {"backendNodeId": self._backend_node_id},
-            session_id=session_id,
-        )
-
-        attributes = result.get("node", {}).get("attributes", [])
-
-        # Attributes come as [name1, value1, name2, value2, ...]
-        for i in range(0, len(attributes), 2):
-            if attributes[i] == name:
-                return attributes[i + 1]
-
-        return None
-
-    async def _resolve_object_id(self) -> str:
-        """Resolve the DOM node into a runtime object ID."""
-        client = self._session.cdp_client
-        session_id = self._session.session_id
-
-        result = await client.send.DOM.resolveNode(
-            {"backendNodeId": self._backend_node_id},
-            session_id=session_id,
-        )
-        object_id = result.get("object", {}).get("objectId")
-
-        if not object_id:
-            raise RuntimeError(f"Could not resolve element {self._backend_node_id}")
+        """
+        Get element attribute value.
 
-        return object_id
+        Attributes are read with one DOM.describeNode and reused until the
+        element is interacted with or invalidate() is called.
+        """
+        if self._attributes is None:
+            result = await self._session.cdp_client.send.DOM.describeNode(
+                {"backendNodeId": self._backend_node_id},
+                session_id=self._session.session_id,
+            )
+            # Attributes come as [name1, value1, name2, value2, ...]
+            attributes = result.get("node", {}).get("attributes", [])
+            self._attributes = dict(zip(attributes[0::2], attributes[1::2], strict=False))
 
-    @staticmethod
-    def _runtime_error_message(result: dict[str, Any]) -> str:
-        """Extract a readable error message from a CDP Runtime response."""
-        details = result.get("exceptionDetails", {}) or {}
-        exception = details.get("exception", {}) or {}
-        return str(exception.get("description") or details.get("text") or details)
+        return self._attributes.get(name)
 
     async def _run_dropdown_interaction(
         self,
@@ -1115,372 +1417,12 @@ class Element:
         open_if_needed: bool = False,
     ) -> dict[str, Any]:
         """Inspect or interact with native and custom dropdown-like controls."""
-        client = self._session.cdp_client
-        session_id = self._session.session_id
-        object_id = await self._resolve_object_id()
-
-        result = await client.send.Runtime.callFunctionOn(
-            {
-                "objectId": object_id,
-                "functionDeclaration": r"""
-                    async function(args) {
-                        const node = this;
-                        const normalize = (value) =>
-                            String(value ?? '').replace(/\s+/g, ' ').trim();
-                        const normalizedNeedle = normalize(args.value).toLowerCase();
-                        const isElement = (value) => value && value.nodeType === Node.ELEMENT_NODE;
-                        const isVisible = (element) => {
-                            if (!isElement(element) || !element.isConnected) return false;
-                            const style = window.getComputedStyle(element);
-                            if (!style) return false;
-                            if (
-                                style.display === 'none' ||
-                                style.visibility === 'hidden'
-                            ) {
-                                return false;
-                            }
-                            if (element.getAttribute('aria-hidden') === 'true') return false;
-                            const rect = element.getBoundingClientRect();
-                            return rect.width > 0 && rect.height > 0;
-                        };
-                        const isDisabled = (element) => (
-                            element.hasAttribute('disabled') ||
-                            element.getAttribute('aria-disabled') === 'true'
-                        );
-                        const optionSelector = [
-                            'option',
-                            '[role="option"]',
-                            '[role="treeitem"]',
-                            '[role="gridcell"]',
-                            '[role="menuitem"]',
-                            '[role="menuitemcheckbox"]',
-                            '[role="menuitemradio"]'
-                        ].join(',');
-                        const rootSelector = [
-                            '[role="listbox"]',
-                            '[role="menu"]',
-                            '[role="tree"]',
-                            '[role="grid"]',
-                            '[data-state="open"]',
-                            '[data-headlessui-state~="open"]'
-                        ].join(',');
-                        const roots = [];
-                        const seenRoots = new Set();
-                        const addRoot = (element) => {
-                            if (!isElement(element) || seenRoots.has(element)) return;
-                            seenRoots.add(element);
-                            roots.push(element);
-                        };
-                        const toOption = (element) => {
-                            const label = normalize(
-                                element.innerText ||
-                                element.textContent ||
-                                element.getAttribute('aria-label') ||
-                                element.getAttribute('label') ||
-                                element.value ||
-                                element.getAttribute('data-value') ||
-                                element.title
-                            );
-                            const value = normalize(
-                                element.value ??
-                                element.getAttribute('value') ??
-                                element.getAttribute('data-value') ??
-                                element.getAttribute('aria-label') ??
-                                label
-                            );
-                            return {
-                                label,
-                                value,
-                                selected:
-                                    element.selected === true ||
-                                    element.getAttribute('aria-selected') === 'true' ||
-                                    element.getAttribute('aria-checked') === 'true',
-                                disabled: isDisabled(element),
-                                role: normalize(element.getAttribute('role')),
-                                tag: normalize(element.tagName)
-                            };
-                        };
-                        const controlledIds = (element) => [
-                            element.getAttribute('aria-controls'),
-                            element.getAttribute('aria-owns')
-                        ]
-                            .filter(Boolean)
-                            .join(' ')
-                            .split(/\s+/)
-                            .map((value) => normalize(value))
-                            .filter(Boolean);
-                        const collectOptions = (root) => {
-                            if (!isElement(root)) return [];
-                            if (root.tagName === 'SELECT') {
-                                return Array.from(root.options).map((element) => ({
-                                    element,
-                                    ...toOption(element)
-                                }));
-                            }
-                            if (root.tagName === 'DATALIST') {
-                                return Array.from(root.options || []).map((element) => ({
-                                    element,
-                                    ...toOption(element)
-                                }));
-                            }
-                            const candidates = root.matches(optionSelector)
-                                ? [root]
-                                : Array.from(root.querySelectorAll(optionSelector));
-                            return candidates
-                                .filter((element) => isVisible(element) || root === node)
-                                .map((element) => ({ element, ...toOption(element) }))
-                                .filter((option) => option.label || option.value);
-                        };
-                        const addControlledRoots = (element) => {
-                            controlledIds(element).forEach((id) => {
-                                addRoot(document.getElementById(id));
-                            });
-                            const activeDescendant = normalize(
-                                element.getAttribute('aria-activedescendant')
-                            );
-                            if (!activeDescendant) return;
-                            const active = document.getElementById(activeDescendant);
-                            if (!active) return;
-                            addRoot(
-                                active.closest(
-                                    '[role="listbox"], [role="menu"], [role="tree"], [role="grid"]'
-                                )
-                            );
-                            addRoot(active);
-                        };
-                        const nodeRect = node.getBoundingClientRect();
-                        const nodeCenter = {
-                            x: nodeRect.left + nodeRect.width / 2,
-                            y: nodeRect.top + nodeRect.height / 2
-                        };
-                        const distance = (element) => {
-                            const rect = element.getBoundingClientRect();
-                            const bx = rect.left + rect.width / 2;
-                            const by = rect.top + rect.height / 2;
-                            return Math.hypot(nodeCenter.x - bx, nodeCenter.y - by);
-                        };
-                        const addNearbyRoots = () => {
-                            Array.from(document.querySelectorAll(rootSelector))
-                                .filter((element) => isVisible(element))
-                                .filter((element) => element !== node)
-                                .filter((element) => {
-                                    return (
-                                        element.matches(optionSelector) ||
-                                        element.querySelector(optionSelector)
-                                    );
-                                })
-                                .map((element) => ({
-                                    element,
-                                    distance: distance(element)
-                                }))
-                                .sort((left, right) => left.distance - right.distance)
-                                .slice(0, 5)
-                                .forEach(({ element }) => addRoot(element));
-                        };
-                        const addIntrinsicRoots = () => {
-                            if (
-                                node.tagName === 'SELECT' ||
-                                node.tagName === 'DATALIST'
-                            ) {
-                                addRoot(node);
-                            }
-                            addRoot(
-                                node.closest(
-                                    '[role="listbox"], [role="menu"], [role="tree"], [role="grid"]'
-                                )
-                            );
-                            if (node.matches(optionSelector)) {
-                                addRoot(node);
-                            }
-                            addControlledRoots(node);
-                            if (!node.id) return;
-                            Array.from(document.querySelectorAll('[aria-labelledby]'))
-                                .filter((element) => {
-                                    const labelledBy = normalize(
-                                        element.getAttribute('aria-labelledby')
-                                    );
-                                    if (!labelledBy) return false;
-                                    return labelledBy.split(/\s+/).includes(node.id);
-                                })
-                                .forEach((element) => addRoot(element));
-                        };
-                        const snapshot = () => {
-                            const seenOptions = new Set();
-                            const options = [];
-                            roots.forEach((root) => {
-                                collectOptions(root).forEach((entry) => {
-                                    const key = [
-                                        entry.label,
-                                        entry.value,
-                                        entry.role,
-                                        entry.tag,
-                                        entry.element.id || ''
-                                    ].join('::');
-                                    if (seenOptions.has(key)) return;
-                                    seenOptions.add(key);
-                                    options.push(entry);
-                                });
-                            });
-                            return options;
-                        };
-                        const refreshOptions = () => {
-                            roots.length = 0;
-                            seenRoots.clear();
-                            addIntrinsicRoots();
-                            addNearbyRoots();
-                            return snapshot();
-                        };
-                        const maybeOpen = async () => {
-                            if (
-                                node.tagName === 'SELECT' ||
-                                node.matches('[role="listbox"], [role="menu"]')
-                            ) {
-                                return {
-                                    opened: false,
-                                    options: refreshOptions()
-                                };
-                            }
-                            node.focus?.();
-                            if (typeof node.showPicker === 'function') {
-                                try {
-                                    node.showPicker();
-                                } catch (error) {
-                                }
-                            }
-                            node.click?.();
-                            const maxWaitMs = 500;
-                            const pollIntervalMs = 50;
-                            let waitedMs = 0;
-                            let options = refreshOptions();
-                            let opened =
-                                node.getAttribute('aria-expanded') === 'true' ||
-                                roots.length > 0;
-
-                            while (!options.length && waitedMs < maxWaitMs) {
-                                await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
-                                waitedMs += pollIntervalMs;
-                                options = refreshOptions();
-                                opened =
-                                    opened ||
-                                    node.getAttribute('aria-expanded') === 'true' ||
-                                    roots.length > 0;
-                            }
-
-                            return {
-                                opened,
-                                options
-                            };
-                        };
-
-                        let options = refreshOptions();
-                        let opened = false;
-
-                        if (!options.length && args.openIfNeeded) {
-                            const openResult = await maybeOpen();
-                            opened = openResult.opened;
-                            options = openResult.options;
-                        }
-
-                        const serializableOptions = options.map(({ element, ...option }) => option);
-                        const kind = node.tagName === 'SELECT'
-                            ? 'select'
-                            : serializableOptions.some((option) =>
-                                option.role.startsWith('menuitem')
-                            )
-                                ? 'menu'
-                                : 'custom';
-
-                        if (args.mode === 'inspect') {
-                            return {
-                                kind,
-                                opened,
-                                options: serializableOptions
-                            };
-                        }
-
-                        if (!normalizedNeedle) {
-                            throw new Error('Option value is required');
-                        }
-
-                        const exactMatch = options.find((option) =>
-                            normalize(option.label).toLowerCase() === normalizedNeedle ||
-                            normalize(option.value).toLowerCase() === normalizedNeedle
-                        );
-                        const partialMatches = options.filter((option) =>
-                            normalize(option.label).toLowerCase().includes(normalizedNeedle) ||
-                            normalize(option.value).toLowerCase().includes(normalizedNeedle)
-                        );
-                        const match = exactMatch || (
-                            partialMatches.length === 1 ? partialMatches[0] : null
-                        );
-
-                        if (!match) {
-                            throw new Error(
-                                `Option not found: ${args.value}. Available: ${serializableOptions
-                                    .map((option) => option.label || option.value)
-                                    .filter(Boolean)
-                                    .join(', ')}`
-                            );
-                        }
-                        if (match.disabled) {
-                            throw new Error(`Option is disabled: ${match.label || match.value}`);
-                        }
-
-                        if (node.tagName === 'SELECT') {
-                            const nativeOption = Array.from(node.options).find((element) =>
-                                normalize(element.text).toLowerCase() === normalizedNeedle ||
-                                normalize(element.value).toLowerCase() === normalizedNeedle
-                            );
-                            if (!nativeOption) {
-                                throw new Error(`Option not found: ${args.value}`);
-                            }
-                            node.value = nativeOption.value;
-                            nativeOption.selected = true;
-                            node.dispatchEvent(new Event('input', { bubbles: true }));
-                            node.dispatchEvent(new Event('change', { bubbles: true }));
-                            return {
-                                kind,
-                                opened,
-                                option: {
-                                    label: normalize(nativeOption.text),
-                                    value: normalize(nativeOption.value)
-                                }
-                            };
-                        }
-
-                        match.element.scrollIntoView?.({ block: 'nearest', inline: 'nearest' });
-                        match.element.click?.();
-                        match.element.dispatchEvent?.(new Event('input', { bubbles: true }));
-                        match.element.dispatchEvent?.(new Event('change', { bubbles: true }));
-                        return {
-                            kind,
-                            opened,
-                            option: {
-                                label: match.label,
-                                value: match.value
-                            }
-                        };
-                    }
-                """,
-                "arguments": [
-                    {
-                        "value": {
-                            "mode": mode,
-                            "value": value,
-                            "openIfNeeded": open_if_needed,
-                        }
-                    }
-                ],
-                "returnByValue": True,
-                "awaitPromise": True,
-            },
-            session_id=session_id,
+        payload = await self._session.call_function_on_node(
+            self._backend_node_id,
+            _DROPDOWN_INTERACTION_JS,
+            [{"mode": mode, "value": value, "openIfNeeded": open_if_needed}],
+            await_promise=True,
         )
-
-        if "exceptionDetails" in result:
-            raise RuntimeError(self._runtime_error_message(result))
-
-        payload = result.get("result", {}).get("value")
         if not isinstance(payload, dict):
             raise RuntimeError("Dropdown interaction returned an invalid response")
 
@@ -1503,6 +1445,7 @@ class Element:
         Returns:
             The text of the selected option
         """
+        self.invalidate()
         result = await self._run_dropdown_interaction(
             mode="select",
             value=value,
@@ -18,6 +18,21 @@ from pydantic import BaseModel, Field, PrivateAttr
 
 logger = logging.getLogger(__name__)
 
+# Object group for cached DOM node handles, so they can be released together
+_NODE_OBJECT_GROUP = "heimdall-nodes"
+
+# Cached node handles per tab before the group is released and rebuilt
+_MAX_NODE_HANDLES = 512
+
+# CDP error messages meaning a cached object handle no longer exists
+_STALE_HANDLE_ERRORS = ("Could not find object with given id", "Cannot find context")
+
+
+def _exception_message(details: dict[str, Any]) -> str:
+    """Extract a readable message from CDP Runtime exceptionDetails."""
+    exception = details.get("exception", {}) or {}
+    return str(exception.get("description") or details.get("text") or details)
+
 
 @dataclass
 class TabInfo:
@@ -44,6 +59,9 @@ class BrowserConfig(BaseModel):
     navigation_timeout: float = 30.0
     action_timeout: float = 10.0
 
+    # Pause between input events like a person would; off for faster automation
+    humanize: bool = False
+
     _original_user_data_dir: str | None = None
     _is_temp_profile: bool = False
 
@@ -127,6 +145,14 @@ class BrowserSession(BaseModel):
     # Tab tracking
     _tabs: dict[str, TabInfo] = PrivateAttr(default_factory=dict)
 
+    # (session_id, backend_node_id) -> remote object ID, dropped when the
+    # page's execution contexts are cleared
+    _object_ids: dict[tuple[str | None, int], str] = PrivateAttr(default_factory=dict)
+
+    # session_id -> layout viewport (width, height), dropped on resize/navigation
+    _viewport_sizes: dict[str | None, tuple[int, int]] = PrivateAttr(default_factory=dict)
+    _viewport_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+
     @property
     def is_connected(self) -> bool:
         """Check if session is connected to browser."""
@@ -181,6 +207,10 @@ class BrowserSession(BaseModel):
         # Enable required CDP domains
         await self._enable_domains()
 
+        # Remote objects die with their execution context
+        self._cdp_client.register.Runtime.executionContextsCleared(self._on_contexts_cleared)
+        self._cdp_client.register.Page.frameResized(self._on_frame_resized)
+
         # Get initial target (first page)
         targets = await self._cdp_client.send.Target.getTargets()
         for target in targets.get("targetInfos", []):
@@ -202,6 +232,9 @@ class BrowserSession(BaseModel):
         # Enable domains on this session
         await self._enable_session_domains()
 
+        # Prime the viewport cache so the first click measures nothing extra
+        await self.get_viewport_size()
+
         # Initialize tab tracking
         self._tabs = {
             self._target_id: TabInfo(
@@ -221,6 +254,8 @@ class BrowserSession(BaseModel):
         if not self._connected:
             return
 
+        await self.release_node_handles()
+
         try:
             if self._cdp_client:
                 await self._cdp_client.stop()
@@ -241,6 +276,8 @@ class BrowserSession(BaseModel):
         self._session_id = None
         self._target_id = None
         self._connected = False
+        self._object_ids.clear()
+        self._viewport_sizes.clear()
 
         logger.info("Browser session stopped")
 
@@ -295,21 +332,24 @@ class BrowserSession(BaseModel):
 
         return base64.b64decode(result["data"])
 
-    async def execute_js(self, expression: str) -> Any:
+    async def execute_js(self, expression: str, silent: bool = False) -> Any:
         """
         Execute JavaScript in page context.
 
         Args:
             expression: JavaScript code to execute
+            silent: Skip serializing the result and don't wait on returned
+                promises. For side-effect-only scripts such as visual overlays.
 
         Returns:
-            Result of JS evaluation
+            Result of JS evaluation, or None when silent
         """
         result = await self._cdp_client.send.Runtime.evaluate(
             {
                 "expression": expression,
-                "returnByValue": True,
-                "awaitPromise": True,
+                "returnByValue": not silent,
+                "awaitPromise": not silent,
+                "silent": silent,
             },
             session_id=self._session_id,
         )
@@ -317,8 +357,222 @@ class BrowserSession(BaseModel):
         if "exceptionDetails" in result:
             raise RuntimeError(f"JS error: {result['exceptionDetails']}")
 
+        if silent:
+            return None
         return result.get("result", {}).get("value")
 
+    async def resolve_backend_node(self, backend_node_id: int) -> str | None:
+        """
+        Resolve a backend node ID into a runtime object ID.
+
+        Handles are cached per tab until the page navigates, and live in
+        their own object group so the page can garbage-collect the nodes
+        once the group is released.
+
+        Args:
+            backend_node_id: CDP backend node ID of the element
+
+        Returns:
+            Remote object ID, or None if the node could not be resolved
+        """
+        key = (self._session_id, backend_node_id)
+        if key in self._object_ids:
+            return self._object_ids[key]
+
+        if sum(1 for tab, _ in self._object_ids if tab == self._session_id) >= _MAX_NODE_HANDLES:
+            await self._release_tab_handles(self._session_id)
+
+        result = await self._cdp_client.send.DOM.resolveNode(
+            {"backendNodeId": backend_node_id, "objectGroup": _NODE_OBJECT_GROUP},
+            session_id=self._session_id,
+        )
+        object_id = result.get("object", {}).get("objectId")
+        if object_id:
+            self._object_ids[key] = object_id
+        return object_id
+
+    async def release_node_handles(self) -> None:
+        """Release every cached DOM node handle so the page can collect the nodes."""
+        for session_id in {tab for tab, _ in self._object_ids}:
+            await self._release_tab_handles(session_id)
+
+    async def _release_tab_handles(self, session_id: str | None) -> None:
+        """Release one tab's node handle group and forget its cached handles."""
+        self._object_ids = {
+            key: object_id for key, object_id in self._object_ids.items() if key[0] != session_id
+        }
+        try:
+            await self._cdp_client.send.Runtime.releaseObjectGroup(
+                {"objectGroup": _NODE_OBJECT_GROUP},
+                session_id=session_id,
+            )
+        except Exception as e:
+            logger.debug(f"Failed to release node handles: {e}")
+
+    async def _on_contexts_cleared(self, params: dict, *args, **kwargs) -> None:
+        """Forget cached object handles and viewport once the page navigates."""
+        self._object_ids.clear()
+        self._viewport_sizes.clear()
+
+    async def _on_frame_resized(self, params: dict, *args, **kwargs) -> None:
+        """Forget cached viewport sizes after a resize."""
+        self._viewport_sizes.clear()
+
+    async def get_viewport_size(self) -> tuple[int, int]:
+        """
+        Get the viewport size in CSS pixels.
+
+        Reads window.innerWidth/innerHeight, which include the scrollbar, so
+        the cached size stays valid when a scrollbar appears or disappears.
+        Cached per tab until the window is resized or the page navigates.
+
+        Returns:
+            Tuple of (width, height)
+        """
+        key = self._session_id
+        if key in self._viewport_sizes:
+            return self._viewport_sizes[key]
+
+        # Concurrent cache misses share one round-trip
+        async with self._viewport_lock:
+            if key not in self._viewport_sizes:
+                width, height = await self.execute_js("[window.innerWidth, window.innerHeight]")
+                self._viewport_sizes[key] = (width, height)
+            return self._viewport_sizes[key]
+
+    async def call_function_on(
+        self,
+        object_id: str,
+        function_declaration: str,
+        args: list[Any] | None = None,
+    ) -> Any:
+        """
+        Call a JavaScript function with `this` bound to a remote object.
+
+        Args:
+            object_id: Remote object ID (see resolve_backend_node)
+            function_declaration: JavaScript function source
+            args: Positional arguments passed by value to the function
+
+        Returns:
+            Result of the function call
+        """
+        result = await self._call_function(object_id, function_declaration, args)
+
+        if "exceptionDetails" in result:
+            raise RuntimeError(f"JS error: {result['exceptionDetails']}")
+
+        return result.get("result", {}).get("value")
+
+    async def call_function_on_node(
+        self,
+        backend_node_id: int,
+        function_declaration: str,
+        args: list[Any] | None = None,
+        await_promise: bool = False,
+    ) -> Any:
+        """
+        Call a JavaScript function with `this` bound to a DOM node.
+
+        Reuses the node's cached object handle so a warm call is a single
+        round-trip. A handle that has gone stale is resolved again once.
+
+        Args:
+            backend_node_id: CDP backend node ID of the element
+            function_declaration: JavaScript function source
+            args: Positional arguments passed by value to the function
+            await_promise: Wait for a returned promise and use its value
+
+        Returns:
+            Result of the function call
+        """
+        key = (self._session_id, backend_node_id)
+        object_id = self._object_ids.get(key)
+        result = None
+
+        if object_id:
+            try:
+                result = await self._call_function(
+                    object_id, function_declaration, args, await_promise
+                )
+            except RuntimeError as e:
+                # Only a dead handle is safe to retry; other errors may have run the function
+                if not any(msg in str(e) for msg in _STALE_HANDLE_ERRORS):
+                    raise
+                logger.debug(f"Stale handle for node {backend_node_id} ({e}), resolving again")
+                self._object_ids.pop(key, None)
+
+        if result is None:
+            object_id = await self.resolve_backend_node(backend_node_id)
+            if not object_id:
+                raise RuntimeError(f"Could not resolve element {backend_node_id}")
+            result = await self._call_function(object_id, function_declaration, args, await_promise)
+
+        if "exceptionDetails" in result:
+            raise RuntimeError(f"JS error: {_exception_message(result['exceptionDetails'])}")
+
+        return result.get("result", {}).get("value")
+
+    async def _call_function(
+        self,
+        object_id: str,
+        function_declaration: str,
+        args: list[Any] | None,
+        await_promise: bool = False,
+    ) -> dict[str, Any]:
+        """Send Runtime.callFunctionOn and return the raw response."""
+        params: dict[str, Any] = {
+            "objectId": object_id,
+            "functionDeclaration": function_declaration,
+            "returnByValue": True,
+        }
+        if await_promise:
+            params["awaitPromise"] = True
+        if args:
+            params["arguments"] = [{"value": arg} for arg in args]
+
+        return await self._cdp_client.send.Runtime.callFunctionOn(
+            params,
+            session_id=self._session_id,
+        )
+
+    async def add_init_script(self, source: str) -> str:
+        """
+        Run a script in the current document and every new document of this tab.
+
+        Args:
+            source: JavaScript source, which should be safe to run more than once
+
+        Returns:
+            Script identifier for Page.removeScriptToEvaluateOnNewDocument
+        """
+        result = await self._cdp_client.send.Page.addScriptToEvaluateOnNewDocument(
+            {"source": source},
+            session_id=self._session_id,
+        )
+        await self.execute_js(source)
+        return result["identifier"]
+
+    async def wait_for_frame(self, timeout: float = 0.05) -> None:
+        """
+        Wait for the page to render its next frame, at most timeout seconds.
+
+        Lets scroll handlers and layout settle after a scroll without a fixed
+        sleep. The cap is enforced in the page so no request is left pending.
+
+        Args:
+            timeout: Maximum time to wait (seconds)
+        """
+        try:
+            await self.execute_js(
+                "new Promise(resolve => {"
+                " requestAnimationFrame(() => resolve());"
+                f" setTimeout(resolve, {int(timeout * 1000)});"
+                " })"
+            )
+        except Exception as e:
+            logger.debug(f"Frame wait failed: {e}")
+
     async def get_url(self) -> str:
         """Get current page URL."""
         return await self.execute_js("window.location.href")
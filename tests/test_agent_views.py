@@ -95,6 +95,18 @@ class TestAgentOutputCurrentState:
         assert brain.memory == ""
         assert brain.next_goal == ""
 
+    def test_action_names_computed_once(self):
+        output = _output(actions=[{"click": {"index": 1}}, {}, {"type": {"text": "hi"}}])
+        names = output.action_names
+        assert names == ["click", "unknown", "type"]
+        assert output.action_names is names
+
+    def test_action_names_not_reused_by_copies(self):
+        output = _output(actions=[{"click": {"index": 1}}])
+        assert output.action_names == ["click"]
+        copy = output.model_copy(update={"action": [{"scroll": {}}]})
+        assert copy.action_names == ["scroll"]
+
 
 # ── AgentHistory.format_for_prompt ────────────────────────────────────────────
 
@@ -269,6 +281,24 @@ class TestAgentHistoryList:
             loaded = AgentHistoryList.load_from_file(filepath)
             assert len(loaded) == 2
 
+    def test_round_trip_empty_history(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = Path(tmp) / "nested" / "history.json"
+            AgentHistoryList().save_to_file(filepath)
+            assert json.loads(filepath.read_text()) == {"history": []}
+            assert len(AgentHistoryList.load_from_file(filepath)) == 0
+
+    def test_round_trip_restores_action_results(self):
+        hl = AgentHistoryList()
+        hl.add(_history(results=[_result(success=False, error="Timed out")]))
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = Path(tmp) / "history.json"
+            hl.save_to_file(filepath)
+            loaded = AgentHistoryList.load_from_file(filepath)
+        result = loaded.history[0].results[0]
+        assert isinstance(result, ActionResult)
+        assert result == _result(success=False, error="Timed out")
+
     def test_saved_json_is_valid(self):
         hl = self._list(1)
         with tempfile.TemporaryDirectory() as tmp:
@@ -279,6 +309,26 @@ class TestAgentHistoryList:
             assert isinstance(data["history"], list)
             assert len(data["history"]) == 1
 
+    def test_saved_json_keeps_all_fields_including_none(self):
+        hl = self._list(1)
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = Path(tmp) / "history.json"
+            hl.save_to_file(filepath)
+            item = json.loads(filepath.read_text())["history"][0]
+            assert set(item) == {
+                "step_number",
+                "model_input",
+                "model_output",
+                "results",
+                "state",
+                "metadata",
+                "state_message",
+            }
+            assert item["model_input"] is None
+            assert item["state"]["screenshot_path"] is None
+            assert item["results"][0]["error"] is None
+            assert item["metadata"]["step_number"] == 1
+
     # ── agent_steps
 
     def test_agent_steps_returns_list_of_strings(self):
@@ -293,3 +343,25 @@ class TestAgentHistoryList:
         assert "Step 1" in steps[0]
         assert "Step 2" in steps[1]
         assert "Step 3" in steps[2]
+
+    def test_agent_steps_include_actions_json(self):
+        hl = self._list(1)
+        steps = hl.agent_steps()
+        assert 'Actions: [\n {\n  "click": {' in steps[0]
+
+    def test_actions_json_is_cached(self):
+        h = _history()
+        first = h.actions_json()
+        assert first is h.actions_json()
+        assert json.loads(first) == [{"click": {"index": 0}}]
+
+    def test_actions_json_not_reused_by_copies(self):
+        h = _history()
+        h.actions_json()
+        copy = h.model_copy(update={"model_output": _output(actions=[{"scroll": {}}])})
+        assert json.loads(copy.actions_json()) == [{"scroll": {}}]
+        assert json.loads(h.actions_json()) == [{"click": {"index": 0}}]
+
+    def test_actions_json_none_without_output(self):
+        h = AgentHistory(step_number=1)
+        assert h.actions_json() is None
@@ -0,0 +1,220 @@
+"""Unit tests for BrowserSession node handle and viewport caching."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from heimdall.browser.session import BrowserSession
+
+
+def _session(object_ids=("obj-1",)):
+    dom = SimpleNamespace(
+        resolveNode=AsyncMock(
+            side_effect=[{"object": {"objectId": object_id}} for object_id in object_ids]
+        ),
+    )
+    runtime = SimpleNamespace(
+        callFunctionOn=AsyncMock(return_value={"result": {"value": "auto"}}),
+        releaseObjectGroup=AsyncMock(return_value={}),
+        evaluate=AsyncMock(return_value={"result": {"value": [800, 600]}}),
+    )
+    session = BrowserSession()
+    session._cdp_client = SimpleNamespace(send=SimpleNamespace(DOM=dom, Runtime=runtime))
+    session._session_id = "session-1"
+    return session
+
+
+class TestCallFunctionOnNode:
+    @pytest.mark.asyncio
+    async def test_handle_is_resolved_once(self):
+        session = _session()
+
+        await session.call_function_on_node(7, "function() {}")
+        value = await session.call_function_on_node(7, "function() {}")
+
+        assert value == "auto"
+        session._cdp_client.send.DOM.resolveNode.assert_awaited_once()
+        assert session._cdp_client.send.Runtime.callFunctionOn.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_handle_is_resolved_again(self):
+        session = _session(object_ids=("obj-1", "obj-2"))
+        call = session._cdp_client.send.Runtime.callFunctionOn
+
+        await session.call_function_on_node(7, "function() {}")
+        call.side_effect = [
+            RuntimeError({"message": "Could not find object with given id"}),
+            {"result": {"value": 1}},
+        ]
+
+        assert await session.call_function_on_node(7, "function() {}") == 1
+        assert call.await_args.args[0]["objectId"] == "obj-2"
+
+    @pytest.mark.asyncio
+    async def test_other_cdp_error_is_raised_without_retry(self):
+        session = _session(object_ids=("obj-1", "obj-2"))
+        call = session._cdp_client.send.Runtime.callFunctionOn
+
+        await session.call_function_on_node(7, "function() {}")
+        call.side_effect = RuntimeError({"message": "Target closed"})
+
+        with pytest.raises(RuntimeError, match="Target closed"):
+            await session.call_function_on_node(7, "function() {}")
+        assert call.await_count == 2
+        session._cdp_client.send.DOM.resolveNode.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_js_exception_is_raised_without_retry(self):
+        session = _session()
+        call = session._cdp_client.send.Runtime.callFunctionOn
+        call.return_value = {"exceptionDetails": {"text": "boom"}}
+
+        with pytest.raises(RuntimeError, match="JS error"):
+            await session.call_function_on_node(7, "function() {}")
+        call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_await_promise_is_kept_on_retry(self):
+        session = _session(object_ids=("obj-1", "obj-2"))
+        call = session._cdp_client.send.Runtime.callFunctionOn
+
+        await session.call_function_on_node(7, "function() {}")
+        call.side_effect = [
+            RuntimeError({"message": "Could not find object with given id"}),
+            {"result": {"value": 1}},
+        ]
+
+        assert await session.call_function_on_node(7, "async function() {}", await_promise=True)
+        assert call.await_args.args[0]["awaitPromise"] is True
+        assert call.await_args.args[0]["objectId"] == "obj-2"
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_node_raises(self):
+        session = _session(object_ids=(None,))
+
+        with pytest.raises(RuntimeError, match="Could not resolve element 7"):
+            await session.call_function_on_node(7, "function() {}")
+
+    @pytest.mark.asyncio
+    async def test_cleared_contexts_drop_cached_handles(self):
+        session = _session(object_ids=("obj-1", "obj-2"))
+
+        await session.call_function_on_node(7, "function() {}")
+        await session._on_contexts_cleared({})
+        await session.call_function_on_node(7, "function() {}")
+
+        assert session._cdp_client.send.DOM.resolveNode.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_handles_are_cached_per_tab(self):
+        session = _session(object_ids=("obj-1", "obj-2"))
+
+        await session.call_function_on_node(7, "function() {}")
+        session._session_id = "session-2"
+        await session.call_function_on_node(7, "function() {}")
+
+        assert session._cdp_client.send.DOM.resolveNode.await_count == 2
+
+
+class TestNodeHandleRelease:
+    @pytest.mark.asyncio
+    async def test_handles_are_resolved_into_object_group(self):
+        session = _session()
+
+        await session.resolve_backend_node(7)
+
+        params = session._cdp_client.send.DOM.resolveNode.await_args.args[0]
+        assert params == {"backendNodeId": 7, "objectGroup": "heimdall-nodes"}
+
+    @pytest.mark.asyncio
+    async def test_release_drops_group_and_cache(self):
+        session = _session(object_ids=("obj-1", "obj-2"))
+
+        await session.resolve_backend_node(7)
+        await session.release_node_handles()
+        await session.resolve_backend_node(7)
+
+        release = session._cdp_client.send.Runtime.releaseObjectGroup
+        release.assert_awaited_once_with({"objectGroup": "heimdall-nodes"}, session_id="session-1")
+        assert session._cdp_client.send.DOM.resolveNode.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_full_cache_releases_group_before_resolving(self, monkeypatch):
+        monkeypatch.setattr("heimdall.browser.session._MAX_NODE_HANDLES", 2)
+        session = _session(object_ids=("obj-1", "obj-2", "obj-3"))
+
+        await session.resolve_backend_node(1)
+        await session.resolve_backend_node(2)
+        session._cdp_client.send.Runtime.releaseObjectGroup.assert_not_awaited()
+        await session.resolve_backend_node(3)
+
+        session._cdp_client.send.Runtime.releaseObjectGroup.assert_awaited_once()
+        assert session._object_ids == {("session-1", 3): "obj-3"}
+
+
+class TestViewportSize:
+    @pytest.mark.asyncio
+    async def test_inner_size_is_fetched_once(self):
+        session = _session()
+
+        assert await session.get_viewport_size() == (800, 600)
+        assert await session.get_viewport_size() == (800, 600)
+
+        session._cdp_client.send.Runtime.evaluate.assert_awaited_once()
+        expression = session._cdp_client.send.Runtime.evaluate.await_args.args[0]["expression"]
+        assert "innerWidth" in expression and "innerHeight" in expression
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        session = _session()
+        metrics = session._cdp_client.send.Runtime.evaluate
+        layout = metrics.return_value
+
+        async def slow_metrics(*args, **kwargs):
+            await asyncio.sleep(0)
+            return layout
+
+        metrics.side_effect = slow_metrics
+
+        sizes = await asyncio.gather(session.get_viewport_size(), session.get_viewport_size())
+
+        assert sizes == [(800, 600), (800, 600)]
+        metrics.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resize_and_navigation_invalidate_the_cache(self):
+        session = _session()
+        metrics = session._cdp_client.send.Runtime.evaluate
+
+        await session.get_viewport_size()
+        await session._on_frame_resized({})
+        await session.get_viewport_size()
+        await session._on_contexts_cleared({})
+        await session.get_viewport_size()
+
+        assert metrics.await_count == 3
+
+
+class TestWaitForFrame:
+    @pytest.mark.asyncio
+    async def test_waits_for_animation_frame_capped_in_page(self, monkeypatch):
+        session = _session()
+        execute_js = AsyncMock()
+        monkeypatch.setattr(BrowserSession, "execute_js", execute_js)
+
+        await session.wait_for_frame(timeout=0.05)
+
+        script = execute_js.await_args.args[0]
+        assert "requestAnimationFrame" in script
+        assert "setTimeout(resolve, 50)" in script
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_raised(self, monkeypatch):
+        session = _session()
+        monkeypatch.setattr(
+            BrowserSession, "execute_js", AsyncMock(side_effect=RuntimeError("closed"))
+        )
+
+        await session.wait_for_frame()
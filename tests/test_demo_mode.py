@@ -0,0 +1,361 @@
+"""Unit tests for DemoMode visual feedback."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from heimdall.browser.demo import _DEMO_HELPER_JS, DemoMode, _bbox_from_quad, _helper_call
+from heimdall.browser.session import BrowserSession
+
+_BORDER = [10.0, 20.0, 110.0, 20.0, 110.0, 60.0, 10.0, 60.0]
+
+
+def _session():
+    dom = SimpleNamespace(
+        getBoxModel=AsyncMock(return_value={"model": {"border": list(_BORDER)}}),
+        scrollIntoViewIfNeeded=AsyncMock(return_value={}),
+    )
+    page = SimpleNamespace(removeScriptToEvaluateOnNewDocument=AsyncMock(return_value={}))
+    return SimpleNamespace(
+        cdp_client=SimpleNamespace(send=SimpleNamespace(DOM=dom, Page=page)),
+        execute_js=AsyncMock(return_value=True),
+        add_init_script=AsyncMock(return_value="script-1"),
+        resolve_backend_node=AsyncMock(return_value="obj-1"),
+        call_function_on=AsyncMock(return_value=True),
+        session_id="session-1",
+    )
+
+
+class TestHighlightElement:
+    @pytest.mark.asyncio
+    async def test_resolves_node_and_calls_function_on_it(self):
+        session = _session()
+        demo = DemoMode(session, background=False)
+
+        await demo.highlight_element(42, color="#00ff00", duration=0.25)
+
+        session.resolve_backend_node.assert_awaited_once_with(42)
+        object_id, _function, args = session.call_function_on.await_args.args
+        assert object_id == "obj-1"
+        assert args == ["#00ff00", 250]
+        session.execute_js.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_node_is_skipped(self):
+        session = _session()
+        session.resolve_backend_node.return_value = None
+        demo = DemoMode(session, background=False)
+
+        await demo.highlight_element(42)
+
+        session.call_function_on.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_swallowed(self):
+        session = _session()
+        session.resolve_backend_node.side_effect = RuntimeError("boom")
+        demo = DemoMode(session, background=False)
+
+        await demo.highlight_element(42)
+
+
+class TestBackgroundScheduling:
+    @pytest.mark.asyncio
+    async def test_tooltip_returns_before_cdp_call_completes(self):
+        session = _session()
+        release = asyncio.Event()
+
+        async def slow_execute(js):
+            await release.wait()
+
+        session.execute_js.side_effect = slow_execute
+        demo = DemoMode(session)
+
+        await demo.show_tooltip("Clicking", x=10, y=10)
+        assert len(demo._tasks) == 1
+
+        release.set()
+        await asyncio.gather(*demo._tasks)
+        assert not demo._tasks
+
+    @pytest.mark.asyncio
+    async def test_clear_joins_batch_of_pending_highlights(self):
+        session = _session()
+        demo = DemoMode(session)
+
+        await demo.show_tooltip("Typing", x=10, y=10)
+        await demo.clear()
+
+        # The tooltip and the clear went out in a single evaluate, in order
+        session.execute_js.assert_awaited_once()
+        js = session.execute_js.await_args.args[0]
+        assert js.index(".tooltip(") < js.index(".clear()")
+        assert all(task.done() for task in demo._tasks)
+
+    @pytest.mark.asyncio
+    async def test_clear_runs_after_overlays_waiting_on_reads(self):
+        session = _session()
+        demo = DemoMode(session)
+
+        await demo.highlight_element_cdp(1)
+        await demo.clear()
+
+        scripts = [c.args[0] for c in session.execute_js.await_args_list]
+        assert ".clear()" in scripts[-1]
+        assert any(".overlay(" in js for js in scripts[:-1])
+        assert not demo._tasks
+
+    @pytest.mark.asyncio
+    async def test_disabled_mode_schedules_nothing(self):
+        session = _session()
+        demo = DemoMode(session)
+        demo.disable()
+
+        await demo.highlight_element(1)
+        await demo.highlight_element_cdp(1)
+        await demo.highlight_by_index(1)
+        await demo.highlight_by_selector("#x")
+        await demo.show_tooltip("x", x=0, y=0)
+        await demo.show_action("click", "Submit")
+
+        assert not demo._tasks
+        session.execute_js.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_enable_restores_feedback_calls(self):
+        session = _session()
+        demo = DemoMode(session, background=False)
+        demo.disable()
+        demo.enable()
+
+        await demo.show_action("click", "Submit button")
+
+        assert demo.is_enabled
+        assert "click: Submit button" in session.execute_js.await_args.args[0]
+
+
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_calls_in_same_tick_share_one_evaluate(self):
+        session = _session()
+        demo = DemoMode(session)
+
+        await demo.show_tooltip("Clicking", x=10, y=10)
+        await demo.highlight_by_selector("#submit")
+        await demo.highlight_by_index(3)
+        await asyncio.gather(*demo._tasks)
+
+        session.execute_js.assert_awaited_once()
+        js = session.execute_js.await_args.args[0]
+        assert js.count("try {") == 3
+        assert "Clicking" in js and "#submit" in js
+        # Overlay writes return nothing worth serializing
+        assert session.execute_js.await_args.kwargs == {"silent": True}
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_logged_not_raised(self):
+        session = _session()
+        session.execute_js.side_effect = RuntimeError("target closed")
+        demo = DemoMode(session, background=False)
+
+        await demo.show_tooltip("Typing", x=0, y=0)
+
+        session.execute_js.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_overlays_measure_together_then_draw_once(self):
+        session = _session()
+        demo = DemoMode(session)
+
+        await demo.highlight_element_cdp(1)
+        await demo.highlight_element_cdp(2)
+        await asyncio.gather(*demo._tasks)
+
+        get_box_model = session.cdp_client.send.DOM.getBoxModel
+        assert [c.args[0] for c in get_box_model.await_args_list] == [
+            {"backendNodeId": 1},
+            {"backendNodeId": 2},
+        ]
+        session.execute_js.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_overlay_scrolls_natively_before_measuring(self):
+        session = _session()
+        sent: list[str] = []
+        dom = session.cdp_client.send.DOM
+        dom.scrollIntoViewIfNeeded.side_effect = lambda params, **_: sent.append("scroll") or {}
+        dom.getBoxModel.side_effect = lambda params, **_: (
+            sent.append("box") or {"model": {"border": list(_BORDER)}}
+        )
+        demo = DemoMode(session, background=False)
+
+        await demo.highlight_element_cdp(7)
+
+        dom.scrollIntoViewIfNeeded.assert_awaited_once_with(
+            {"backendNodeId": 7}, session_id="session-1"
+        )
+        assert sent == ["scroll", "box"]
+        js = session.execute_js.await_args.args[0]
+        assert ".overlay(10.0, 20.0, 100.0, 40.0, 1000);" in js
+
+    @pytest.mark.asyncio
+    async def test_overlay_drawn_when_scroll_fails(self):
+        session = _session()
+        session.cdp_client.send.DOM.scrollIntoViewIfNeeded.side_effect = RuntimeError("old target")
+        demo = DemoMode(session, background=False)
+
+        await demo.highlight_element_cdp(7)
+
+        session.execute_js.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_overlay_skipped_without_border(self):
+        session = _session()
+        session.cdp_client.send.DOM.getBoxModel.return_value = {"model": {}}
+        demo = DemoMode(session, background=False)
+
+        await demo.highlight_element_cdp(1)
+
+        session.execute_js.assert_not_awaited()
+
+
+class TestPageHelper:
+    @pytest.mark.asyncio
+    async def test_helper_installed_once_per_session(self):
+        session = _session()
+        demo = DemoMode(session, background=False)
+
+        await demo.show_tooltip("One", x=0, y=0)
+        await demo.show_tooltip("Two", x=0, y=0)
+
+        session.add_init_script.assert_awaited_once()
+        assert session.execute_js.await_count == 2
+
+        session.session_id = "session-2"
+        await demo.show_tooltip("Three", x=0, y=0)
+        assert session.add_init_script.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_calls_ship_arguments_not_source(self):
+        session = _session()
+        demo = DemoMode(session, background=False)
+
+        await demo.highlight_by_selector("a[href='x']", color="#00ff00", duration=0.25)
+
+        js = session.execute_js.await_args.args[0]
+        assert 'window.__heimdallDemo.bySelector("a[href=\'x\']", "#00ff00", 250);' in js
+        assert "createElement" not in js
+
+    @pytest.mark.asyncio
+    async def test_close_removes_helper_from_every_tab(self):
+        session = _session()
+        session.add_init_script.side_effect = ["script-1", "script-2"]
+        demo = DemoMode(session, background=False)
+
+        await demo.show_tooltip("One", x=0, y=0)
+        session.session_id = "session-2"
+        await demo.show_tooltip("Two", x=0, y=0)
+        await demo.close()
+
+        remove = session.cdp_client.send.Page.removeScriptToEvaluateOnNewDocument
+        assert [
+            (c.args[0]["identifier"], c.kwargs["session_id"]) for c in remove.await_args_list
+        ] == [
+            ("script-1", "session-1"),
+            ("script-2", "session-2"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disable_removes_helper_and_enable_reinstalls_it(self):
+        session = _session()
+        demo = DemoMode(session, background=False)
+
+        await demo.show_tooltip("One", x=0, y=0)
+        demo.disable()
+        await asyncio.gather(*demo._tasks)
+
+        remove = session.cdp_client.send.Page.removeScriptToEvaluateOnNewDocument
+        remove.assert_awaited_once_with({"identifier": "script-1"}, session_id="session-1")
+
+        demo.enable()
+        await demo.show_tooltip("Two", x=0, y=0)
+        assert session.add_init_script.await_count == 2
+
+    def test_styles_are_injected_on_first_draw_only(self):
+        # Every call to ensureStyles sits inside a drawing function
+        body = _DEMO_HELPER_JS.split("window.__heimdallDemo =")[0]
+        assert "DOMContentLoaded" not in body
+        assert "\n    ensureStyles();" not in body
+
+    @pytest.mark.asyncio
+    async def test_clear_skips_tab_without_helper(self):
+        session = _session()
+        demo = DemoMode(session)
+
+        await demo.clear()
+
+        session.execute_js.assert_not_awaited()
+
+
+class _ClosedSession:
+    """A session whose CDP accessors fail the way a stopped BrowserSession does."""
+
+    execute_js = AsyncMock()
+    add_init_script = AsyncMock()
+
+    @property
+    def cdp_client(self):
+        raise RuntimeError("Browser session not started.")
+
+    @property
+    def session_id(self):
+        raise RuntimeError("No active session.")
+
+
+class TestClosedSession:
+    @pytest.mark.asyncio
+    async def test_overlay_read_failure_does_not_hang(self):
+        demo = DemoMode(_ClosedSession())
+
+        await demo.highlight_element_cdp(1)
+        await asyncio.wait_for(asyncio.gather(*demo._tasks), timeout=1)
+
+        assert all(task.done() for task in demo._tasks)
+
+    @pytest.mark.asyncio
+    async def test_clear_on_unstarted_session_is_a_no_op(self):
+        demo = DemoMode(BrowserSession())
+
+        await asyncio.wait_for(demo.clear(), timeout=1)
+
+
+class TestBboxFromQuad:
+    def test_axis_aligned_quad(self):
+        assert _bbox_from_quad(_BORDER) == (10.0, 20.0, 100.0, 40.0)
+
+    def test_rotated_quad_uses_extremes(self):
+        # A square rotated 45 degrees around (50, 50)
+        quad = [50.0, 0.0, 100.0, 50.0, 50.0, 100.0, 0.0, 50.0]
+        assert _bbox_from_quad(quad) == (0.0, 0.0, 100.0, 100.0)
+
+
+class TestHelperCall:
+    def test_text_is_json_encoded(self):
+        text = 'It\'s "quoted" \\ </script>\nnext line – ✓'
+        js = _helper_call("tooltip", text, 20, 20, 1500)
+        assert js.startswith("window.__heimdallDemo.tooltip(")
+        args = json.loads("[" + js[len("window.__heimdallDemo.tooltip(") : -2] + "]")
+        assert args == [text, 20, 20, 1500]
+        assert "✓" in js
+
+    @pytest.mark.asyncio
+    async def test_show_action_text_reaches_page_unchanged(self):
+        session = _session()
+        demo = DemoMode(session, background=False)
+
+        await demo.show_action("type", "field: 'name'")
+
+        assert "\"type: field: 'name'\"" in session.execute_js.await_args.args[0]
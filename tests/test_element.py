@@ -0,0 +1,441 @@
+"""Unit tests for Element interactions."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from heimdall.browser.element import BoundingBox, Element, dispatch_mouse_click
+
+_QUAD = [10.0, 20.0, 110.0, 20.0, 110.0, 60.0, 10.0, 60.0]
+
+
+def _session(hit_result=None):
+    send = SimpleNamespace(
+        DOM=SimpleNamespace(
+            getContentQuads=AsyncMock(return_value={"quads": [list(_QUAD)]}),
+            getBoxModel=AsyncMock(return_value={"model": {"content": list(_QUAD)}}),
+            scrollIntoViewIfNeeded=AsyncMock(return_value={}),
+            describeNode=AsyncMock(return_value={"node": {"nodeId": 3}}),
+            focus=AsyncMock(return_value={}),
+        ),
+        Input=SimpleNamespace(
+            dispatchMouseEvent=AsyncMock(return_value={}),
+            dispatchKeyEvent=AsyncMock(return_value={}),
+            insertText=AsyncMock(return_value={}),
+        ),
+    )
+    return SimpleNamespace(
+        cdp_client=SimpleNamespace(send=send),
+        session_id="session-1",
+        config=SimpleNamespace(humanize=False),
+        get_viewport_size=AsyncMock(return_value=(800, 600)),
+        wait_for_frame=AsyncMock(),
+        call_function_on_node=AsyncMock(return_value=hit_result or {"ok": True, "reason": ""}),
+    )
+
+
+def _mouse_events(session):
+    calls = session.cdp_client.send.Input.dispatchMouseEvent.await_args_list
+    return [call.args[0]["type"] for call in calls]
+
+
+class TestClick:
+    @pytest.mark.asyncio
+    async def test_clicks_center_of_quad(self):
+        session = _session()
+
+        await Element(session, 5).click()
+
+        assert _mouse_events(session) == ["mouseMoved", "mousePressed", "mouseReleased"]
+        pressed = session.cdp_client.send.Input.dispatchMouseEvent.await_args_list[1].args[0]
+        assert (pressed["x"], pressed["y"]) == (60, 40)
+
+    @pytest.mark.asyncio
+    async def test_pointer_events_and_hit_target_share_one_probe(self):
+        session = _session()
+
+        await Element(session, 5).click()
+
+        session.call_function_on_node.assert_awaited_once()
+        backend_node_id, function, args = session.call_function_on_node.await_args.args
+        assert (backend_node_id, args) == (5, [60, 40])
+        assert "pointerEvents" in function and "elementFromPoint(x, y)" in function
+
+    @pytest.mark.asyncio
+    async def test_geometry_is_measured_once_after_scrolling(self):
+        session = _session()
+        dom = session.cdp_client.send.DOM
+
+        await Element(session, 5).click()
+
+        dom.scrollIntoViewIfNeeded.assert_awaited_once()
+        dom.getBoxModel.assert_awaited_once()
+        dom.getContentQuads.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missed_box_centre_retries_on_line_boxes(self):
+        session = _session()
+        dom = session.cdp_client.send.DOM
+        dom.getContentQuads.return_value = {"quads": [[10, 20, 50, 20, 50, 30, 10, 30]]}
+        session.call_function_on_node.side_effect = [
+            {"ok": False, "reason": "hit P instead"},
+            {"ok": True, "reason": ""},
+        ]
+
+        await Element(session, 5).click()
+
+        dom.getContentQuads.assert_awaited_once()
+        pressed = session.cdp_client.send.Input.dispatchMouseEvent.await_args_list[1].args[0]
+        assert (pressed["x"], pressed["y"]) == (30, 25)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_content_quads_without_box_model(self):
+        session = _session()
+        dom = session.cdp_client.send.DOM
+        dom.getBoxModel.side_effect = RuntimeError("no layout object")
+
+        await Element(session, 5).click()
+
+        dom.getContentQuads.assert_awaited_once()
+        assert _mouse_events(session) == ["mouseMoved", "mousePressed", "mouseReleased"]
+
+    @pytest.mark.asyncio
+    async def test_visible_bbox_skips_scroll_and_geometry_discovery(self):
+        session = _session()
+        dom = session.cdp_client.send.DOM
+
+        await Element(session, 5).click(bbox=BoundingBox(x=10, y=20, width=100, height=40))
+
+        dom.scrollIntoViewIfNeeded.assert_not_awaited()
+        dom.getBoxModel.assert_not_awaited()
+        assert _mouse_events(session) == ["mouseMoved", "mousePressed", "mouseReleased"]
+
+    @pytest.mark.asyncio
+    async def test_offscreen_bbox_is_ignored(self):
+        session = _session()
+
+        await Element(session, 5).click(bbox=BoundingBox(x=10, y=900, width=100, height=40))
+
+        session.cdp_client.send.DOM.scrollIntoViewIfNeeded.assert_awaited_once()
+        session.cdp_client.send.DOM.getBoxModel.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_bbox_falls_back_to_robust_path(self):
+        session = _session()
+        session.call_function_on_node.side_effect = [
+            {"ok": False, "reason": "covered by DIV"},
+            {"ok": True, "reason": ""},
+        ]
+
+        await Element(session, 5).click(bbox=BoundingBox(x=200, y=200, width=10, height=10))
+
+        session.cdp_client.send.DOM.getBoxModel.assert_awaited_once()
+        pressed = session.cdp_client.send.Input.dispatchMouseEvent.await_args_list[1].args[0]
+        assert (pressed["x"], pressed["y"]) == (60, 40)
+
+    @pytest.mark.asyncio
+    async def test_blocked_target_falls_back_to_js_click(self):
+        session = _session(hit_result={"ok": False, "reason": "pointer-events: none"})
+
+        await Element(session, 5).click()
+
+        assert _mouse_events(session) == []
+        assert "this.click()" in session.call_function_on_node.await_args.args[1]
+
+
+class TestDispatchMouseClick:
+    @pytest.mark.asyncio
+    async def test_events_are_sent_back_to_back(self, monkeypatch):
+        session = _session()
+        sleep = AsyncMock()
+        monkeypatch.setattr("heimdall.browser.element.asyncio.sleep", sleep)
+
+        await dispatch_mouse_click(session, x=5, y=6)
+
+        assert _mouse_events(session) == ["mouseMoved", "mousePressed", "mouseReleased"]
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delay_paces_events(self, monkeypatch):
+        session = _session()
+        sleep = AsyncMock()
+        monkeypatch.setattr("heimdall.browser.element.asyncio.sleep", sleep)
+
+        await dispatch_mouse_click(session, x=5, y=6, delay=0.03)
+
+        assert sleep.await_count == 2
+
+
+class TestHumanize:
+    @pytest.mark.asyncio
+    async def test_click_events_are_paced_only_when_humanized(self, monkeypatch):
+        sleep = AsyncMock()
+        monkeypatch.setattr("heimdall.browser.element.asyncio.sleep", sleep)
+
+        await Element(_session(), 5)._dispatch_click(1, 2, "left", 1, 0)
+        sleep.assert_not_awaited()
+
+        session = _session()
+        session.config.humanize = True
+        await Element(session, 5)._dispatch_click(1, 2, "left", 1, 0)
+        assert sleep.await_count == 2
+
+
+class TestFocus:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_js_focus_through_node_handle(self):
+        session = _session()
+        session.cdp_client.send.DOM.focus.side_effect = RuntimeError("not focusable")
+
+        await Element(session, 5).focus()
+
+        session.call_function_on_node.assert_awaited_once_with(5, "function() { this.focus(); }")
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_node_cannot_be_focused(self):
+        session = _session()
+        session.cdp_client.send.DOM.focus.side_effect = RuntimeError("not focusable")
+        session.call_function_on_node.side_effect = RuntimeError("Could not resolve element 5")
+
+        with pytest.raises(RuntimeError, match="Could not focus element 5"):
+            await Element(session, 5).focus()
+
+    @pytest.mark.asyncio
+    async def test_focuses_by_backend_node_id_in_one_call(self):
+        session = _session()
+
+        await Element(session, 5).focus()
+
+        session.cdp_client.send.DOM.describeNode.assert_not_awaited()
+        session.cdp_client.send.DOM.focus.assert_awaited_once_with(
+            {"backendNodeId": 5}, session_id="session-1"
+        )
+
+
+class TestGetAttribute:
+    @pytest.mark.asyncio
+    async def test_attributes_are_described_once_until_interaction(self, monkeypatch):
+        monkeypatch.setattr("heimdall.browser.element.asyncio.sleep", AsyncMock())
+        session = _session()
+        describe = session.cdp_client.send.DOM.describeNode
+        describe.return_value = {"node": {"attributes": ["id", "name", "type", "text"]}}
+        element = Element(session, 5)
+
+        assert await element.get_attribute("type") == "text"
+        assert await element.get_attribute("href") is None
+        describe.assert_awaited_once()
+
+        await element.click()
+        await element.get_attribute("type")
+        assert describe.await_count == 2
+
+
+class TestSelectOption:
+    @pytest.mark.asyncio
+    async def test_dropdown_call_goes_through_cached_handle(self):
+        session = _session()
+        session.call_function_on_node.return_value = {"option": {"label": "Canada"}}
+
+        assert await Element(session, 5).select_option("Canada") == "Canada"
+
+        backend_node_id, _, args = session.call_function_on_node.await_args.args
+        assert (backend_node_id, args[0]["value"]) == (5, "Canada")
+        assert session.call_function_on_node.await_args.kwargs == {"await_promise": True}
+
+    @pytest.mark.asyncio
+    async def test_invalid_payload_raises(self):
+        session = _session()
+        session.call_function_on_node.return_value = None
+
+        with pytest.raises(RuntimeError, match="invalid response"):
+            await Element(session, 5).get_dropdown_options()
+
+
+class TestFill:
+    @pytest.mark.asyncio
+    async def test_plain_input_is_prepared_in_one_call(self, monkeypatch):
+        sleep = AsyncMock()
+        monkeypatch.setattr("heimdall.browser.element.asyncio.sleep", sleep)
+        session = _session(hit_result={"focused": True, "cleared": True})
+
+        await Element(session, 5).fill("hello")
+
+        sleep.assert_not_awaited()
+        session.wait_for_frame.assert_not_awaited()
+
+        session.call_function_on_node.assert_awaited_once()
+        assert session.call_function_on_node.await_args.args[2] == [True]
+        session.cdp_client.send.DOM.scrollIntoViewIfNeeded.assert_not_awaited()
+        session.cdp_client.send.DOM.focus.assert_not_awaited()
+        session.cdp_client.send.Input.insertText.assert_awaited_once_with(
+            {"text": "hello"}, session_id="session-1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_key_mode_types_each_character(self):
+        session = _session(hit_result={"focused": True, "cleared": True})
+
+        await Element(session, 5).fill("a\n", mode="keys")
+
+        events = [c.args[0] for c in session.cdp_client.send.Input.dispatchKeyEvent.await_args_list]
+        assert [e["key"] for e in events] == ["a", "a", "a", "Enter", "Enter", "Enter"]
+        session.cdp_client.send.Input.insertText.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unfocused_field_takes_the_robust_path(self, monkeypatch):
+        monkeypatch.setattr("heimdall.browser.element.asyncio.sleep", AsyncMock())
+        session = _session()
+        session.call_function_on_node.side_effect = [{"focused": False, "cleared": False}, True]
+
+        await Element(session, 5).fill("hello")
+
+        session.cdp_client.send.DOM.scrollIntoViewIfNeeded.assert_awaited_once()
+        session.cdp_client.send.DOM.focus.assert_awaited_once()
+        assert "execCommand('delete')" in session.call_function_on_node.await_args.args[1]
+        session.wait_for_frame.assert_awaited()
+        session.cdp_client.send.Input.insertText.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_click_to_focus_skips_a_second_scroll(self):
+        session = _session()
+        session.cdp_client.send.DOM.focus.side_effect = RuntimeError("not focusable")
+        session.call_function_on_node.side_effect = [
+            {"focused": False, "cleared": False},
+            RuntimeError("focus() threw"),
+            {"ok": True, "reason": ""},
+        ]
+
+        await Element(session, 5).fill("hello", clear=False)
+
+        session.cdp_client.send.DOM.scrollIntoViewIfNeeded.assert_awaited_once()
+        session.cdp_client.send.DOM.getBoxModel.assert_awaited_once()
+        assert _mouse_events(session) == ["mouseMoved", "mousePressed", "mouseReleased"]
+        session.cdp_client.send.Input.insertText.assert_awaited_once()
+
+
+class TestClearField:
+    @pytest.mark.asyncio
+    async def test_plain_input_is_cleared_in_one_call(self):
+        session = _session(hit_result=True)
+
+        await Element(session, 5)._clear_field_robust()
+
+        session.call_function_on_node.assert_awaited_once()
+        assert "execCommand('delete')" in session.call_function_on_node.await_args.args[1]
+        session.cdp_client.send.Input.dispatchKeyEvent.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_contenteditable_uses_keyboard_shortcuts(self, monkeypatch):
+        monkeypatch.setattr("heimdall.browser.element.asyncio.sleep", AsyncMock())
+        session = _session()
+        session.call_function_on_node.return_value = False
+
+        await Element(session, 5)._clear_field_robust()
+
+        keys = session.cdp_client.send.Input.dispatchKeyEvent.await_args_list
+        assert [call.args[0]["key"] for call in keys] == ["a", "a", "Backspace", "Backspace"]
+
+    @pytest.mark.asyncio
+    async def test_triple_click_reuses_measured_box(self):
+        session = _session()
+        session.call_function_on_node.side_effect = [False, {"ok": True, "reason": ""}]
+        input_ = session.cdp_client.send.Input
+
+        async def key_event(params, **kwargs):
+            if params["key"] != "Delete":
+                raise RuntimeError("keyboard unavailable")
+
+        input_.dispatchKeyEvent.side_effect = key_event
+
+        await Element(session, 5)._clear_field_robust()
+
+        session.cdp_client.send.DOM.getBoxModel.assert_awaited_once()
+        session.cdp_client.send.DOM.scrollIntoViewIfNeeded.assert_not_awaited()
+        pressed = input_.dispatchMouseEvent.await_args_list[1].args[0]
+        assert (pressed["x"], pressed["y"], pressed["clickCount"]) == (60, 40, 3)
+        assert input_.dispatchKeyEvent.await_args.args[0]["key"] == "Delete"
+
+
+class TestModifierFlags:
+    def test_combines_modifier_bits(self):
+        element = Element(_session(), 5)
+
+        assert element._calculate_modifier_flags(["Control", "Shift"]) == 10
+        assert element._calculate_modifier_flags(None) == 0
+
+
+class TestKeyInfo:
+    def test_looks_up_us_layout_keys(self):
+        element = Element(_session(), 5)
+
+        assert element._get_key_info("A") == ("A", "KeyA", 65, 8)
+        assert element._get_key_info("a") == ("a", "KeyA", 65, 0)
+        assert element._get_key_info("7") == ("7", "Digit7", 55, 0)
+        assert element._get_key_info("?") == ("?", "Slash", 191, 8)
+
+    def test_other_characters_are_sent_as_text(self):
+        element = Element(_session(), 5)
+
+        assert element._get_key_info("é") == ("é", "", 0, 0)
+
+
+class TestTypeChar:
+    @pytest.mark.asyncio
+    async def test_sends_down_char_up_for_table_and_other_characters(self):
+        session = _session()
+        element = Element(session, 5)
+
+        await element._type_char("A")
+        await element._type_char("é")
+
+        events = [c.args[0] for c in session.cdp_client.send.Input.dispatchKeyEvent.await_args_list]
+        assert [e["type"] for e in events] == ["keyDown", "char", "keyUp"] * 2
+        assert (events[0]["code"], events[0]["modifiers"], events[1]["text"]) == ("KeyA", 8, "A")
+        assert events[4]["text"] == "é"
+        assert "code" not in events[3] and "modifiers" not in events[3]
+
+
+class TestSpecialKey:
+    @pytest.mark.asyncio
+    async def test_enter_types_a_carriage_return(self):
+        session = _session()
+
+        await Element(session, 5)._type_special_key("Enter", 13)
+
+        events = [c.args[0] for c in session.cdp_client.send.Input.dispatchKeyEvent.await_args_list]
+        assert [e["type"] for e in events] == ["keyDown", "char", "keyUp"]
+        assert events[1]["text"] == "\r"
+
+    @pytest.mark.asyncio
+    async def test_other_keys_are_down_up_only(self):
+        session = _session()
+
+        await Element(session, 5)._type_special_key("Tab", 9)
+
+        events = session.cdp_client.send.Input.dispatchKeyEvent.await_args_list
+        assert [c.args[0]["type"] for c in events] == ["keyDown", "keyUp"]
+
+
+class TestFindBestClickPoint:
+    def test_prefers_quad_with_largest_visible_area(self):
+        element = Element(_session(), 5)
+        offscreen = [-500.0, 0.0, -400.0, 0.0, -400.0, 10.0, -500.0, 10.0]
+        small = [0.0, 0.0, 10.0, 0.0, 10.0, 10.0, 0.0, 10.0]
+
+        point = element._find_best_click_point([offscreen, small, list(_QUAD)], 800, 600)
+
+        assert point == (60, 40)
+
+    def test_clamps_partly_visible_quad_center_to_viewport(self):
+        element = Element(_session(), 5)
+        quad = [700.0, 0.0, 1000.0, 0.0, 1000.0, 20.0, 700.0, 20.0]
+
+        assert element._find_best_click_point([quad], 800, 600) == (799, 10)
+
+    def test_falls_back_to_first_quad_then_viewport_center(self):
+        element = Element(_session(), 5)
+        below = [0.0, 900.0, 10.0, 900.0, 10.0, 910.0, 0.0, 910.0]
+
+        assert element._find_best_click_point([below], 800, 600) == (5, 599)
+        assert element._find_best_click_point([], 800, 600) == (400, 300)